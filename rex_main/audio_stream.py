@@ -17,6 +17,7 @@ No FFmpeg or PulseAudio required.
 from __future__ import annotations
 
 import asyncio
+import functools
 from typing import Optional
 import numpy as np
 import sounddevice as sd
@@ -24,7 +25,23 @@ import sounddevice as sd
 import logging
 logger = logging.getLogger(__name__)
 
-__all__ = ["AudioStream"]
+__all__ = ["AudioStream", "query_devices_cached"]
+
+
+@functools.lru_cache(maxsize=8)
+def query_devices_cached(device: Optional[int | str] = None,
+                         kind: Optional[str] = None):
+    """Memoized wrapper around ``sd.query_devices``.
+
+    Walking the PortAudio device list costs 20-100 ms on some hosts and
+    the result is stable for the lifetime of the process, so startup and
+    CLI paths share one enumeration instead of repeating it.
+    """
+    if device is None and kind is None:
+        return sd.query_devices()
+    if kind is None:
+        return sd.query_devices(device)
+    return sd.query_devices(device, kind=kind)
 
 
 class AudioStream:
@@ -42,6 +59,20 @@ class AudioStream:
         Input device index or name. None uses system default.
     """
 
+    # Slots keep attribute reads in the per-frame callback at C-level
+    # offset lookups instead of dict probes, and catch attribute typos.
+    __slots__ = ("queue", "samplerate", "frame_len", "frame_ms", "device",
+                 "_stream", "_loop", "_ring", "_ring_idx")
+
+    # Preallocated capture ring, in frames. The writer advances one row
+    # per 32 ms of wall clock regardless of what consumers do, so frame
+    # counts downstream say nothing about how long a row stays valid:
+    # consumers must copy a frame out promptly (both VAD paths copy at
+    # append; pre-speech deques hold views for ~100 ms). 512 rows (~16 s,
+    # 1 MB) exist only to give queue residency generous slack, not to
+    # make long-lived views safe.
+    _RING_FRAMES = 512
+
     def __init__(
         self,
         queue: asyncio.Queue,
@@ -59,6 +90,10 @@ class AudioStream:
         self.device = device
         self._stream: Optional[sd.InputStream] = None
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # One big contiguous block, recycled row by row: the steady-state
+        # capture path allocates nothing per frame.
+        self._ring = np.empty((self._RING_FRAMES, self.frame_len), dtype=np.float32)
+        self._ring_idx = 0
 
         if pulse_server:
             logger.warning("pulse_server parameter is deprecated and ignored. Using native audio capture.")
@@ -80,18 +115,30 @@ class AudioStream:
             logger.warning("Audio callback status: %s", status)
 
         # indata is (frames, channels) - we want mono float32
-        # sounddevice gives us float32 in range [-1, 1] already
-        audio = indata[:, 0].copy()  # Take first channel, copy to avoid memory issues
-
-        # Put into queue (non-blocking from callback thread)
-        # Use a helper that catches QueueFull to avoid spamming errors
-        def _enqueue(data):
-            try:
-                self.queue.put_nowait(data)
-            except asyncio.QueueFull:
-                pass  # Silently drop frame - this happens during slow transcription
-
-        self._loop.call_soon_threadsafe(lambda: _enqueue(audio))
+        # sounddevice gives us float32 in range [-1, 1] already, so no
+        # int16 -> float32 scaling pass is needed here (PortAudio converts
+        # once, in C). A copy is still required because PortAudio reuses
+        # *indata* after the callback returns - but it goes into the next
+        # row of the preallocated ring, so nothing is allocated per frame.
+        audio = self._ring[self._ring_idx]
+        self._ring_idx = (self._ring_idx + 1) % self._RING_FRAMES
+        if len(audio) == len(indata):
+            audio[:] = indata[:, 0]
+        else:
+            # Partial block (stream start/stop edge); fall back to a copy.
+            audio = np.ascontiguousarray(indata[:, 0])
+
+        # Put into queue (non-blocking from callback thread). Hand the bound
+        # method straight to call_soon_threadsafe - building a closure and a
+        # lambda per 32 ms frame just creates allocator churn on the hot path.
+        self._loop.call_soon_threadsafe(self._enqueue, audio)
+
+    def _enqueue(self, data: np.ndarray):
+        """Runs on the event loop; drops the frame if the queue is full."""
+        try:
+            self.queue.put_nowait(data)
+        except asyncio.QueueFull:
+            pass  # Silently drop frame - this happens during slow transcription
 
     def _start_stream(self):
         """Start the sounddevice input stream."""
@@ -103,11 +150,11 @@ class AudioStream:
 
         # List available input devices
         try:
-            devices = sd.query_devices()
+            devices = query_devices_cached()
             default_input = sd.default.device[0]
 
             if default_input is not None and default_input >= 0:
-                dev_info = sd.query_devices(default_input, kind="input")
+                dev_info = query_devices_cached(default_input, kind="input")
                 logger.info("Using audio input: [%d] %s", default_input, dev_info.get("name", "Unknown"))
             else:
                 # Find first available input device
@@ -133,6 +180,10 @@ class AudioStream:
                 device=self.device,
                 channels=1,
                 dtype=np.float32,
+                # Ask PortAudio for its low-latency buffer size instead of
+                # the conservative default, which adds tens of ms of
+                # device-side buffering before the first callback fires.
+                latency="low",
                 callback=self._audio_callback,
             )
             self._stream.start()
@@ -153,7 +204,7 @@ def list_audio_devices() -> list[dict]:
     devices = []
     default_input = sd.default.device[0]
 
-    for i, dev in enumerate(sd.query_devices()):
+    for i, dev in enumerate(query_devices_cached()):
         if dev.get("max_input_channels", 0) > 0:
             devices.append({
                 "index": i,
@@ -119,8 +119,9 @@ def run(ctx: click.Context):
             console.print("[yellow]Dashboard dependencies not installed. Install with: pip install rex-voice-assistant[dashboard][/yellow]")
 
     # Import and run main
-    from rex_main.rex import run_assistant
+    from rex_main.rex import run_assistant, install_uvloop
 
+    install_uvloop()
     try:
         asyncio.run(run_assistant(opts, config))
     except KeyboardInterrupt:
@@ -349,9 +350,10 @@ def status():
     # Show audio device info
     try:
         import sounddevice as sd
+        from rex_main.audio_stream import query_devices_cached
         default_input = sd.default.device[0]
         if default_input is not None and default_input >= 0:
-            dev_info = sd.query_devices(default_input)
+            dev_info = query_devices_cached(default_input)
             console.print(f"  Input device: {dev_info['name']}")
         else:
             console.print("  Input device: [yellow]No default set[/yellow]")
@@ -1,20 +1,85 @@
 # commands.py  – v2 (https://github.com/ytmdesktop/ytmdesktop/wiki/v2-%E2%80%90-Companion-Server-API-v1)
 from __future__ import annotations
+import asyncio
+import functools
+import json
 import os
 import requests
-from typing import Any, Optional
-from ytmusicapi import YTMusic
-from spotipy import Spotify
-from spotipy.oauth2 import SpotifyOAuth
+from typing import Any, Callable, Optional
+
+# ytmusicapi and spotipy are imported lazily where they are first needed:
+# both pull in sizeable dependency graphs that would otherwise be paid at
+# import time by every entry point (rex status, the matcher, tests), even
+# when the other service - or none - is active.
 
 import logging
 logger = logging.getLogger(__name__)
 
 '''Confusingly, YTMD app currently interfaces as the v2 api, but has v1 in the URL.'''
 
+# aiohttp is an optional dependency ([integrations]); probe for it once.
+_aiohttp = None
+_aiohttp_checked = False
+
+
+# Unauthenticated YTMusic client, built once: construction parses config
+# and headers, which is real latency on a "play X by Y" voice command.
+_ytm = None
+
+
+def _get_ytm():
+    global _ytm
+    if _ytm is None:
+        from ytmusicapi import YTMusic
+        _ytm = YTMusic()
+    return _ytm
+
+
+@functools.lru_cache(maxsize=256)
+def _ytm_search(query: str) -> tuple:
+    """Memoized top-hit search so repeat requests skip the network."""
+    return tuple(_get_ytm().search(query, filter="songs", limit=1))
+
+
+def _get_aiohttp():
+    """Lazy-load aiohttp, or None if it isn't installed."""
+    global _aiohttp, _aiohttp_checked
+    if not _aiohttp_checked:
+        _aiohttp_checked = True
+        try:
+            import aiohttp
+            _aiohttp = aiohttp
+        except ImportError:
+            logger.debug("aiohttp not installed; YTMD commands use threaded requests")
+    return _aiohttp
+
+
+# The assistant's event loop, registered by run_assistant.  Handlers are
+# dispatched through run_in_executor in the standard pipeline, so
+# asyncio.get_running_loop() fails inside them; deferred work (the volume
+# debounce timer) schedules onto this loop instead.
+_event_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def bind_event_loop(loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+    """Register the running event loop for fire-and-forget scheduling.
+
+    Called by run_assistant at startup; with no argument the calling
+    loop is captured.
+    """
+    global _event_loop
+    _event_loop = loop or asyncio.get_running_loop()
+
+
+# Strong references to in-flight fire-and-forget sends: the event loop
+# only keeps weak references to tasks, so without these a send can be
+# garbage-collected mid-flight and silently never reach the service.
+_BG_TASKS: set[asyncio.Task] = set()
+
 __all__ = [
   # mode switching
   "configure_spotify", "configure_ytmd", "configure_from_config",
+  "aclose_service",
   # shared
   "play_music", "stop_music", "next_track", "previous_track",
   "restart_track", "search_song", "volume_up", "volume_down",
@@ -34,6 +99,25 @@ __all__ = [
 class YTMD:
     """Thin client for YT Music Desktop Companion-Server (POST /api/v1/command)."""
 
+    __slots__ = (
+        "host", "port", "token", "timeout",
+        "_base_url", "_state_url", "_headers", "_session", "_aio_session",
+        "_volume", "_vol_delta", "_vol_timer",
+    )
+
+    # Debounce window for bursty volume commands ("volume down volume down
+    # volume down"), and the step each spoken up/down applies.
+    _VOL_DEBOUNCE_S = 0.08
+    _VOL_STEP = 5
+
+    # Value-less commands have constant payloads; encode them once so the
+    # common case (play/pause/next/...) skips dict build + json.dumps.
+    _CONST_PAYLOADS = {
+        cmd: json.dumps({"command": cmd}).encode()
+        for cmd in ("play", "pause", "next", "previous",
+                    "volumeUp", "volumeDown", "toggleLike", "toggleDislike")
+    }
+
     def __init__(
         self,
         host: str | None = None,
@@ -47,24 +131,83 @@ class YTMD:
         self.timeout = timeout
 
         self._base_url = f"http://{self.host}:{self.port}/api/v1/command"
-        self._headers  = {"Content-Type": "application/json"}
+        self._state_url = f"http://{self.host}:{self.port}/api/v1/state"
+        self._headers  = {"Content-Type": "application/json",
+                          "Connection": "keep-alive"}
         if self.token:                       # include only if present
             self._headers["Authorization"] = self.token
 
+        # One pooled session for all commands: keeps the TCP connection to
+        # the local Companion Server alive instead of paying a fresh
+        # three-way handshake per voice command. A short retry absorbs the
+        # occasional dropped keep-alive socket without surfacing it as a
+        # failed voice command.
+        from urllib3.util.retry import Retry
+
+        self._session = requests.Session()
+        self._session.headers.update(self._headers)
+        self._session.mount(
+            "http://",
+            requests.adapters.HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=4,
+                max_retries=Retry(total=2, backoff_factor=0.1),
+            ),
+        )
+
+        # aiohttp session, created lazily inside the running loop
+        self._aio_session = None
+
+        # Volume debounce state: bursts of up/down accumulate here and are
+        # flushed as a single setVolume once the burst goes quiet.
+        self._volume: Optional[int] = None   # last known absolute level
+        self._vol_delta = 0
+        self._vol_timer: Optional[asyncio.TimerHandle] = None
+
 
     #  helper
     def _send(self, command: str, *, value: Optional[Any] = None) -> None:
+        """Send *command* to the Companion Server.
+
+        Called from inside a running event loop, the HTTP round-trip is
+        scheduled as a fire-and-forget background task so the VAD/Whisper
+        coroutines never stall behind a slow or absent YTMD.  Outside a
+        loop (setup wizard, tests) it stays synchronous.
+        """
         payload: dict[str, Any] = {"command": command}
         if value is not None:
             payload["data"] = value
 
         try:
-            r = requests.post(
-                self._base_url,
-                json=payload,
-                headers=self._headers,
-                timeout=self.timeout,
-            )
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._post_sync(command, payload)
+            return
+
+        if _get_aiohttp() is not None:
+            task = loop.create_task(self._post_async(command, payload))
+            _BG_TASKS.add(task)
+            task.add_done_callback(_BG_TASKS.discard)
+        else:
+            loop.run_in_executor(None, self._post_quiet, command, payload)
+
+    def _post_sync(self, command: str, payload: dict[str, Any]) -> None:
+        # Both sessions send Content-Type: application/json in their default
+        # headers, so pre-encoded bodies can go out via data= as-is.
+        body = None if "data" in payload else self._CONST_PAYLOADS.get(command)
+        try:
+            if body is not None:
+                r = self._session.post(
+                    self._base_url,
+                    data=body,
+                    timeout=self.timeout,
+                )
+            else:
+                r = self._session.post(
+                    self._base_url,
+                    json=payload,
+                    timeout=self.timeout,
+                )
             r.raise_for_status()
         except requests.exceptions.Timeout:
             logger.error("YTMD command %r timed out after %ss", command, self.timeout)
@@ -78,7 +221,40 @@ class YTMD:
             logger.error("YTMD command %r connection error: %s", command, e)
             raise
         else:
-            logger.debug("YTMD: %s (%s)", command, value)
+            logger.debug("YTMD: %s (%s)", command, payload.get("data"))
+
+    def _post_quiet(self, command: str, payload: dict[str, Any]) -> None:
+        """Executor wrapper: errors are already logged, don't re-raise."""
+        try:
+            self._post_sync(command, payload)
+        except requests.exceptions.RequestException:
+            pass
+
+    async def _post_async(self, command: str, payload: dict[str, Any]) -> None:
+        aiohttp = _get_aiohttp()
+        if self._aio_session is None or self._aio_session.closed:
+            self._aio_session = aiohttp.ClientSession(
+                headers=self._headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        body = None if "data" in payload else self._CONST_PAYLOADS.get(command)
+        try:
+            if body is not None:
+                post = self._aio_session.post(self._base_url, data=body)
+            else:
+                post = self._aio_session.post(self._base_url, json=payload)
+            async with post as r:
+                r.raise_for_status()
+            logger.debug("YTMD: %s (%s)", command, payload.get("data"))
+        except asyncio.TimeoutError:
+            logger.error("YTMD command %r timed out after %ss", command, self.timeout)
+        except aiohttp.ClientError as e:
+            logger.error("YTMD command %r failed: %s", command, e)
+
+    async def aclose(self) -> None:
+        """Close the async HTTP session (call on shutdown)."""
+        if self._aio_session is not None and not self._aio_session.closed:
+            await self._aio_session.close()
 
 
 
@@ -86,10 +262,9 @@ class YTMD:
         """
         Search YouTube Music (actual) for "title [+ artist]" and play the first match.
         """
-        # 1) Build and run the search
+        # 1) Build and run the search (client + result both cached)
         query = f"{title} by {artist}" if artist else title
-        ytm = YTMusic()
-        results = ytm.search(query, filter="songs", limit=1)
+        results = _ytm_search(query)
 
         if not results:
             logger.error("No YTM results for %r", query)
@@ -129,9 +304,10 @@ class YTMD:
 
     # volume
     def volume_up(self):
-        self._send("volumeUp")
+        self._bump_volume(+self._VOL_STEP)
+
     def volume_down(self):
-        self._send("volumeDown")
+        self._bump_volume(-self._VOL_STEP)
 
     def set_volume(self, level: int | str) -> None:
         try:
@@ -139,8 +315,115 @@ class YTMD:
         except (ValueError, TypeError):
             logger.error("Bad volume value: %s", level)
             return
+        # An explicit level supersedes any pending debounced delta; the
+        # timer lives on the loop, so cancel it there when called from an
+        # executor thread.
+        loop = self._get_loop()
+        if loop is None or self._on_loop(loop):
+            self._cancel_pending_bump()
+        else:
+            loop.call_soon_threadsafe(self._cancel_pending_bump)
+        self._volume = vol
         self._send("setVolume", value=vol)
 
+    @staticmethod
+    def _get_loop() -> Optional[asyncio.AbstractEventLoop]:
+        """The loop to debounce on: the current one, or the bound one when
+        running in an executor thread."""
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        if _event_loop is not None and _event_loop.is_running():
+            return _event_loop
+        return None
+
+    @staticmethod
+    def _on_loop(loop: asyncio.AbstractEventLoop) -> bool:
+        try:
+            return asyncio.get_running_loop() is loop
+        except RuntimeError:
+            return False
+
+    def _cancel_pending_bump(self) -> None:
+        if self._vol_timer is not None:
+            self._vol_timer.cancel()
+            self._vol_timer = None
+        self._vol_delta = 0
+
+    def _bump_volume(self, step: int) -> None:
+        """Accumulate a relative volume change and debounce the flush.
+
+        Rapid "volume down volume down volume down" collapses into one
+        setVolume request instead of three sequential round-trips.
+        Handlers run either on the loop itself (low-latency mode) or in
+        an executor thread (standard dispatch); both marshal onto the
+        loop so the timer state has a single owner.  With no loop at all
+        (setup wizard, tests) the relative command goes out immediately.
+        """
+        loop = self._get_loop()
+        if loop is None:
+            self._send("volumeUp" if step > 0 else "volumeDown")
+            return
+        if self._on_loop(loop):
+            self._bump_on_loop(step)
+        else:
+            loop.call_soon_threadsafe(self._bump_on_loop, step)
+
+    def _bump_on_loop(self, step: int) -> None:
+        self._vol_delta += step
+        if self._vol_timer is not None:
+            self._vol_timer.cancel()
+        self._vol_timer = asyncio.get_running_loop().call_later(
+            self._VOL_DEBOUNCE_S, self._flush_volume
+        )
+
+    def _flush_volume(self) -> None:
+        """Loop callback at the end of a burst; must never block."""
+        self._vol_timer = None
+        delta = self._vol_delta
+        self._vol_delta = 0
+        if delta == 0:
+            return
+        if self._volume is not None:
+            self._volume = max(0, min(100, self._volume + delta))
+            self._send("setVolume", value=self._volume)
+            return
+        # Absolute level unknown: resolving it takes a blocking state GET,
+        # which has no place on the event loop - finish in the executor.
+        asyncio.get_running_loop().run_in_executor(
+            None, self._resolve_and_apply, delta
+        )
+
+    def _resolve_and_apply(self, delta: int) -> None:
+        """Executor side of a flush: fetch the absolute level, apply *delta*."""
+        vol = self._fetch_volume()
+        if vol is None:
+            # State endpoint unreachable: replay the relative steps so the
+            # net change is still correct.
+            command = "volumeUp" if delta > 0 else "volumeDown"
+            for _ in range(abs(delta) // self._VOL_STEP):
+                self._post_quiet(command, {"command": command})
+            return
+        self._volume = max(0, min(100, vol + delta))
+        self._post_quiet("setVolume", {"command": "setVolume", "data": self._volume})
+
+    def _fetch_volume(self) -> Optional[int]:
+        """Read the player volume from the Companion Server state endpoint.
+
+        Blocking; callers reach this via the executor only.  Done at most
+        once per burst and only until a level is cached; failures just
+        mean we fall back to relative steps.
+        """
+        try:
+            r = self._session.get(self._state_url, timeout=self.timeout)
+            r.raise_for_status()
+            vol = r.json().get("player", {}).get("volume")
+            return int(vol) if vol is not None else None
+        except (requests.exceptions.RequestException, ValueError, TypeError) as e:
+            logger.debug("YTMD state fetch failed: %s", e)
+            return None
+
 
     # thumbs
     def like(self):
@@ -167,6 +450,9 @@ class SpotifyClient:
     )
 
     def __init__(self):
+        from spotipy import Spotify
+        from spotipy.oauth2 import SpotifyOAuth
+
         # this will pop open a browser on first run so you can log in
         auth = SpotifyOAuth(
             scope=self.SCOPE,
@@ -175,16 +461,24 @@ class SpotifyClient:
         )
         self.sp = Spotify(auth_manager=auth)
 
-        # pick your desktop app as the playback target
+    @functools.cached_property
+    def device_id(self) -> str:
+        """Playback target, resolved lazily on the first playback command.
+
+        Deferring the devices() round-trip means constructing the client
+        (e.g. at startup when Spotify is the active service) no longer
+        requires the desktop app to already be running.
+        """
         devices = self.sp.devices().get("devices", [])
         if not devices:
             raise RuntimeError("No Spotify Connect devices found.")
         # find the one named “Your Computer” or just take the first
-        self.device_id = next(
+        device_id = next(
             (d["id"] for d in devices if "Computer" in d["name"]),
             devices[0]["id"]
         )
-        logger.info("Using Spotify Connect device %r", self.device_id)
+        logger.info("Using Spotify Connect device %r", device_id)
+        return device_id
 
 
     def search_song(self, title: str, artist: str | None = None) -> None:
@@ -322,18 +616,47 @@ class SpotifyClient:
 
 current_service = None
 
+# The active client instance.  The bound methods installed into module
+# globals below don't expose it, and shutdown needs it to close the
+# client's HTTP sessions.
+current_client = None
+
+# O(1) dispatch table for the matcher: maps handler names to the bound
+# methods of the active service.  Rebuilt on every configure_service call
+# so the latency-critical path does a dict .get instead of module getattr.
+HANDLERS: dict[str, Callable] = {}
+
+_HANDLER_NAMES = (
+    "play_music", "stop_music", "next_track", "previous_track",
+    "restart_track", "search_song", "volume_up", "volume_down",
+    "set_volume", "like", "dislike", "so_sad",
+    "shuffle_on", "shuffle_off", "set_repeat", "queue_track",
+    "current_track_info",
+    "configure_spotify", "configure_ytmd",
+)
+
+
+def _rebuild_handlers() -> None:
+    """Refresh HANDLERS from the module globals after a service switch."""
+    g = globals()
+    HANDLERS.clear()
+    HANDLERS.update({name: g[name] for name in _HANDLER_NAMES if name in g})
+
+
 def configure_service(mode: str):
     """
     Bind play_music, stop_music, next_track, previous_track
     to either YTMD or SpotifyClient, based on `mode`.
     """
-    global current_service, play_music, stop_music, next_track, previous_track, \
+    global current_service, current_client, play_music, stop_music, next_track, previous_track, \
             restart_track, search_song, volume_up, volume_down, set_volume, like,\
              dislike, so_sad, shuffle_on, shuffle_off, set_repeat, queue_track, current_track_info
 
     current_service = mode.lower()
+    current_client = None
     if current_service == "ytmd":
         client = YTMD()
+        current_client = client
         play_music     = client.play_music
         stop_music     = client.stop_music
         next_track     = client.next_track
@@ -352,6 +675,7 @@ def configure_service(mode: str):
 
     elif current_service == "spotify":
         client = SpotifyClient()
+        current_client = client
         play_music    = client.play_music
         stop_music    = client.stop_music
         next_track    = client.next_track
@@ -406,14 +730,30 @@ def configure_service(mode: str):
         current_track_info = _noop_info
 
         logger.warning("Running in transcription-only mode (no music service configured)")
+        _rebuild_handlers()
         return
 
     else:
         raise ValueError(f"Unknown service mode: {mode!r}")
 
+    _rebuild_handlers()
     logger.info("Media service configured to %s", current_service)
 
 
+async def aclose_service() -> None:
+    """Flush in-flight sends and close the active client's HTTP sessions.
+
+    Called from run_assistant's shutdown path; without it the lazily
+    created aiohttp session leaks with an "Unclosed client session"
+    warning.
+    """
+    if _BG_TASKS:
+        await asyncio.gather(*_BG_TASKS, return_exceptions=True)
+    closer = getattr(current_client, "aclose", None)
+    if closer is not None:
+        await closer()
+
+
 def configure_from_config(config: dict) -> None:
     """Configure the music service from a configuration dictionary.
 
@@ -10,24 +10,44 @@ Provides:
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import threading
 from pathlib import Path
 from typing import Optional, Set
 
+try:
+    import orjson  # C-extension JSON, 3-10x faster on metric dicts
+except ImportError:  # pragma: no cover - optional, stdlib json still works
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _json_dumps(obj) -> str:
+    """Serialize to a JSON string, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
 # Global state for the dashboard server
 _server_thread: Optional[threading.Thread] = None
 _should_stop = threading.Event()
 _websocket_clients: Set = set()
+_broadcast_task: Optional[asyncio.Task] = None
+# Loop-side shutdown signal: created in the server's event loop and set via
+# call_soon_threadsafe from stop_dashboard(), so websocket tasks can await it
+# instead of polling the threading.Event once a second.
+_server_loop: Optional[asyncio.AbstractEventLoop] = None
+_stop_event: Optional[asyncio.Event] = None
 
 
 def _get_app():
     """Create and configure the FastAPI application."""
     try:
         from fastapi import FastAPI, WebSocket, WebSocketDisconnect
-        from fastapi.responses import HTMLResponse, JSONResponse
+        from fastapi.responses import HTMLResponse, JSONResponse, Response
         from fastapi.staticfiles import StaticFiles
     except ImportError:
         raise ImportError(
@@ -37,38 +57,60 @@ def _get_app():
 
     from rex_main.metrics import metrics
 
+    if orjson is not None:
+        class ORJSONResponse(Response):
+            """JSONResponse minus the pure-Python encoder hot loop.
+
+            Matters most on /api/history, whose payload can carry hundreds
+            of latency samples per request.
+            """
+            media_type = "application/json"
+
+            def render(self, content) -> bytes:
+                return orjson.dumps(content)
+    else:
+        ORJSONResponse = JSONResponse
+
     app = FastAPI(title="REX Dashboard", docs_url=None, redoc_url=None)
 
     # Static files directory
     static_dir = Path(__file__).parent / "static"
 
+    # Read the dashboard HTML once at app construction; serving cached bytes
+    # avoids a disk read + UTF-8 decode on every refresh.
+    index_file = static_dir / "index.html"
+    index_bytes = index_file.read_bytes() if index_file.exists() else None
+
     @app.get("/", response_class=HTMLResponse)
     async def index():
         """Serve the dashboard HTML."""
-        index_file = static_dir / "index.html"
-        if index_file.exists():
-            return HTMLResponse(content=index_file.read_text(), status_code=200)
+        if index_bytes is not None:
+            return HTMLResponse(
+                content=index_bytes,
+                status_code=200,
+                headers={"Cache-Control": "public, max-age=60"},
+            )
         return HTMLResponse(content="<h1>Dashboard not found</h1>", status_code=404)
 
     @app.get("/api/stats")
     async def get_stats():
         """Get current session statistics."""
-        return JSONResponse(content=metrics.get_session_stats())
+        return ORJSONResponse(content=metrics.get_session_stats())
 
     @app.get("/api/commands")
     async def get_commands():
         """Get command frequency data."""
-        return JSONResponse(content=metrics.get_command_frequency())
+        return ORJSONResponse(content=metrics.get_command_frequency())
 
     @app.get("/api/recent")
     async def get_recent():
         """Get recent transcriptions."""
-        return JSONResponse(content=metrics.get_recent_transcriptions(limit=20))
+        return ORJSONResponse(content=metrics.get_recent_transcriptions(limit=20))
 
     @app.get("/api/history")
     async def get_history(minutes: int = 60):
         """Get latency history for charts."""
-        return JSONResponse(content=metrics.get_latency_history(minutes=minutes))
+        return ORJSONResponse(content=metrics.get_latency_history(minutes=minutes))
 
     @app.get("/api/benchmark")
     async def get_benchmark():
@@ -76,7 +118,7 @@ def _get_app():
         try:
             from rex_main.benchmark import benchmark
             system_stats = benchmark.get_system_stats()
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "cpu_percent": system_stats.cpu_percent,
                 "cpu_per_core": system_stats.cpu_per_core,
                 "memory_percent": system_stats.memory_percent,
@@ -91,7 +133,77 @@ def _get_app():
             })
         except Exception as e:
             logger.debug("Benchmark data not available: %s", e)
-            return JSONResponse(content={"error": "Benchmark not available"})
+            return ORJSONResponse(content={"error": "Benchmark not available"})
+
+    async def _broadcast_loop():
+        """Single shared push loop for all WebSocket clients.
+
+        Builds and serializes the payload once per tick and fans the same
+        string out to every client, instead of each connection running its
+        own snapshot/serialize loop (which cost 3N metric calls per second
+        for N dashboards).  When no new metric events arrived and there is
+        no live resource data to refresh, nothing is sent at all.
+        """
+        # Import benchmark for resource stats
+        try:
+            from rex_main.benchmark import benchmark
+            has_benchmark = True
+        except ImportError:
+            has_benchmark = False
+
+        last_version = -1
+        while not _should_stop.is_set():
+            try:
+                # Tick once a second, but wake immediately on shutdown.
+                await asyncio.wait_for(_stop_event.wait(), timeout=1.0)
+                break
+            except asyncio.TimeoutError:
+                pass
+            if not _websocket_clients:
+                continue
+
+            version = metrics.version
+            if version == last_version and not has_benchmark:
+                # Nothing changed and no resource gauges to refresh.
+                continue
+            last_version = version
+
+            data = metrics.snapshot(limit_recent=10, limit_cmd=10)
+
+            # Add benchmark/resource data
+            if has_benchmark:
+                try:
+                    system_stats = benchmark.get_system_stats()
+                    data["resources"] = {
+                        "cpu_percent": system_stats.cpu_percent,
+                        "memory_percent": system_stats.memory_percent,
+                        "gpu_available": system_stats.gpu_available,
+                        "gpu_name": system_stats.gpu_name,
+                        "gpu_percent": system_stats.gpu_percent,
+                        "gpu_memory_used_mb": system_stats.gpu_memory_used_mb,
+                        "gpu_memory_total_mb": system_stats.gpu_memory_total_mb,
+                        "gpu_temperature": system_stats.gpu_temperature,
+                    }
+                except Exception:
+                    pass
+
+            # Serialize once; send_json would re-encode per client.
+            payload = _json_dumps(data)
+            clients = list(_websocket_clients)
+            results = await asyncio.gather(
+                *(ws.send_text(payload) for ws in clients),
+                return_exceptions=True,
+            )
+            for ws, result in zip(clients, results):
+                if isinstance(result, Exception):
+                    _websocket_clients.discard(ws)
+
+    def _ensure_broadcaster():
+        global _broadcast_task
+        if _broadcast_task is None or _broadcast_task.done():
+            _broadcast_task = asyncio.get_running_loop().create_task(
+                _broadcast_loop(), name="dashboard-broadcast"
+            )
 
     @app.websocket("/ws")
     async def websocket_endpoint(websocket: WebSocket):
@@ -100,47 +212,26 @@ def _get_app():
         try:
             await websocket.accept()
             _websocket_clients.add(websocket)
+            _ensure_broadcaster()
             logger.debug("WebSocket client connected, total: %d", len(_websocket_clients))
 
             try:
-                # Import benchmark for resource stats
+                # Updates arrive via the shared broadcaster; this loop only
+                # exists to notice disconnects or a shutdown signal.
+                stop_task = asyncio.create_task(_stop_event.wait())
                 try:
-                    from rex_main.benchmark import benchmark
-                    has_benchmark = True
-                except ImportError:
-                    has_benchmark = False
-
-                while True:
-                    # Check stop signal
-                    if _should_stop.is_set():
-                        break
-
-                    # Send stats every second
-                    data = {
-                        "stats": metrics.get_session_stats(),
-                        "recent": metrics.get_recent_transcriptions(limit=10),
-                        "commands": metrics.get_command_frequency()[:10],
-                    }
-
-                    # Add benchmark/resource data
-                    if has_benchmark:
-                        try:
-                            system_stats = benchmark.get_system_stats()
-                            data["resources"] = {
-                                "cpu_percent": system_stats.cpu_percent,
-                                "memory_percent": system_stats.memory_percent,
-                                "gpu_available": system_stats.gpu_available,
-                                "gpu_name": system_stats.gpu_name,
-                                "gpu_percent": system_stats.gpu_percent,
-                                "gpu_memory_used_mb": system_stats.gpu_memory_used_mb,
-                                "gpu_memory_total_mb": system_stats.gpu_memory_total_mb,
-                                "gpu_temperature": system_stats.gpu_temperature,
-                            }
-                        except Exception:
-                            pass
-
-                    await websocket.send_json(data)
-                    await asyncio.sleep(1)
+                    while True:
+                        recv_task = asyncio.create_task(websocket.receive_text())
+                        done, _ = await asyncio.wait(
+                            {recv_task, stop_task},
+                            return_when=asyncio.FIRST_COMPLETED,
+                        )
+                        if stop_task in done:
+                            recv_task.cancel()
+                            break
+                        recv_task.result()  # raises WebSocketDisconnect on close
+                finally:
+                    stop_task.cancel()
             except WebSocketDisconnect:
                 logger.debug("WebSocket client disconnected normally")
             except Exception as e:
@@ -182,8 +273,11 @@ def _run_server(host: str, port: int):
     server = uvicorn.Server(config)
 
     # Run until stop signal
+    global _server_loop, _stop_event
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
+    _server_loop = loop
+    _stop_event = asyncio.Event()
 
     async def serve():
         await server.serve()
@@ -245,17 +339,21 @@ def start_dashboard(host: str = "127.0.0.1", port: int = 9876) -> bool:
 
 def stop_dashboard():
     """Stop the dashboard server."""
-    global _server_thread
+    global _server_thread, _broadcast_task, _server_loop, _stop_event
 
     _should_stop.set()
+    _broadcast_task = None
 
-    # Close all websocket connections
-    for ws in list(_websocket_clients):
+    # Wake any tasks awaiting the loop-side stop event so connections close
+    # in milliseconds instead of at the next poll tick.
+    if _server_loop is not None and _stop_event is not None:
         try:
-            asyncio.run(ws.close())
-        except Exception:
-            pass
+            _server_loop.call_soon_threadsafe(_stop_event.set)
+        except RuntimeError:
+            pass  # loop already closed
     _websocket_clients.clear()
+    _server_loop = None
+    _stop_event = None
 
     if _server_thread is not None:
         _server_thread.join(timeout=2)
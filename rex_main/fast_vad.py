@@ -18,16 +18,15 @@ import torch
 import logging
 import time
 
+from rex_main.frame_pool import utterance_pool
 from rex_main.metrics import metrics
 from rex_main.benchmark import benchmark
+from rex_main.vad_stream import EnergyGate, OnnxVAD, load_vad_model
 
 logger = logging.getLogger(__name__)
 
 __all__ = ["FastVAD"]
 
-_REPO = "snakers4/silero-vad"
-_MODEL = "silero_vad"
-
 
 class FastVAD:
     """Optimized VAD with early command detection.
@@ -60,6 +59,9 @@ class FastVAD:
         Minimum speech before attempting early transcription (default: 300).
     early_check_interval_ms : int
         How often to attempt early transcription (default: 200).
+    energy_gate_db : float or None
+        Margin (dB over noise floor) for the energy pre-filter that skips
+        Silero inference on quiet frames (default: 6.0, None disables).
     """
 
     def __init__(
@@ -76,6 +78,7 @@ class FastVAD:
         min_speech_ms: int = 300,
         early_check_interval_ms: int = 200,
         max_utterance_ms: int = 10_000,
+        energy_gate_db: Optional[float] = 6.0,
     ):
         self.in_q = in_queue
         self.transcribe = transcribe_func
@@ -96,55 +99,167 @@ class FastVAD:
         self.pre_speech_frames = 100 // frame_ms  # 100ms
         self._pre_buf: deque = deque(maxlen=self.pre_speech_frames)
 
-        # VAD model
-        self._model: Optional[torch.jit.ScriptModule] = None
+        # Silero V5/V6 runs on a fixed 512-sample window at 16 kHz
+        frame_len = int(sample_rate * frame_ms / 1000)
+        if frame_len != 512:
+            logger.warning(
+                "Silero VAD expects 512-sample windows, got %d "
+                "(sample_rate=%d, frame_ms=%d)",
+                frame_len, sample_rate, frame_ms,
+            )
+
+        # Energy pre-filter: skip NN inference on obviously-quiet frames
+        self._gate: Optional[EnergyGate] = (
+            EnergyGate(frame_len, margin_db=energy_gate_db)
+            if energy_gate_db is not None else None
+        )
+        self._gate_reset_frames = 2_000 // frame_ms  # ~2 s of gated silence
+        self._gated_silence = 0
+
+        # VAD model (OnnxVAD or TorchScript module)
+        self._model: Optional[OnnxVAD | torch.jit.ScriptModule] = None
 
         logger.info(
             "FastVAD: silence=%dms, min_speech=%dms, early_check=%dms",
             silence_ms, min_speech_ms, early_check_interval_ms
         )
 
-    async def run(self):
+    async def run(self):  # noqa: C901
         """Main VAD loop with early command detection."""
         self._lazy_init()
 
-        speech_buf: list[np.ndarray] = []
+        # In-progress utterance: frames are copied into a pooled buffer as
+        # they arrive, the same as SileroVAD.  Holding raw views of the
+        # capture ring here is not safe: the ring writer advances a row
+        # every 32 ms of wall clock (dropped frames included), so a long
+        # unmatched utterance plus the transcription awaits below can lap
+        # the ring and tear frames that are still referenced.  Copying at
+        # append bounds each view's lifetime to one frame.  (Frames parked
+        # in in_q under a Whisper backlog have the same wall-clock
+        # exposure; the bounded queue keeps that residency short by
+        # dropping new frames when full.)
+        utt_buf: Optional[np.ndarray] = None
+        utt_len = 0     # samples written
+        utt_frames = 0  # frames written
         silence_ctr = 0
         frames_since_check = 0
         last_early_text = ""
         command_executed = False
 
+        def _append(frame: np.ndarray) -> None:
+            nonlocal utt_len, utt_frames
+            n = len(frame)
+            utt_buf[utt_len:utt_len + n] = frame
+            utt_len += n
+            utt_frames += 1
+
+        def _reset() -> None:
+            nonlocal utt_buf, utt_len, utt_frames, silence_ctr
+            nonlocal frames_since_check, command_executed, last_early_text
+            if utt_buf is not None:
+                utterance_pool.release(utt_buf)
+                utt_buf = None
+            utt_len = utt_frames = 0
+            self._pre_buf.clear()
+            silence_ctr = 0
+            frames_since_check = 0
+            command_executed = False
+            last_early_text = ""
+
+        async def _finalize() -> None:
+            # Utterance ended without an early match - run the final
+            # transcription and matching pass over the filled prefix.
+            audio = utt_buf[:utt_len]
+            duration_ms = utt_frames * self.frame_ms
+
+            logger.info(
+                "FastVAD flushing utterance: %d frames (~%.2f s)",
+                utt_frames, duration_ms / 1000
+            )
+            metrics.record_vad_emit(duration_ms)
+
+            # Final transcription
+            t0 = time.perf_counter()
+            text = await asyncio.get_running_loop().run_in_executor(
+                None, self.transcribe, audio
+            )
+            dt = (time.perf_counter() - t0) * 1000
+
+            if text:
+                metrics.record_transcription(text, dt)
+                benchmark.record_vad_complete(duration_ms, duration_ms)
+                benchmark.record_transcription(dt)
+
+                matched, cmd_name, args, _ = self.match(text)
+
+                if matched and cmd_name:
+                    metrics.record_command_match(cmd_name, matched=True)
+                    t1 = time.perf_counter()
+                    self.execute(cmd_name, args)
+                    exec_dt = (time.perf_counter() - t1) * 1000
+                    metrics.record_command_execute(cmd_name, exec_dt)
+                    benchmark.record_command(cmd_name, text, True, exec_dt, early_match=False)
+                else:
+                    metrics.record_command_match(None, matched=False)
+                    benchmark.record_command("none", text, False, 0.0, early_match=False)
+                    logger.debug("No command matched: %r", text)
+
         while True:
             frame = await self.in_q.get()
 
-            # Always update pre-buffer when not in speech
-            if not speech_buf:
+            # Always update pre-buffer when not in speech.  These views
+            # live for at most pre_speech_frames (~100 ms) before being
+            # copied into utt_buf, well inside the ring's period.
+            if utt_buf is None:
                 self._pre_buf.append(frame)
 
-            speech_prob = self._infer(frame)
+            if self._gate is None or self._gate.is_active(frame):
+                speech_prob = self._infer(frame)
+                self._gated_silence = 0
+            else:
+                speech_prob = 0.0
+                self._gated_silence += 1
+                if (self._gated_silence == self._gate_reset_frames
+                        and hasattr(self._model, "reset_states")):
+                    self._model.reset_states()
 
             if speech_prob >= self.speech_th:
-                # Speech detected
-                if not speech_buf:
-                    # First speech frame - prepend pre-buffer
-                    speech_buf.extend(self._pre_buf)
+                # Continuous speech past the hard cut-off or the pooled
+                # buffer's capacity finalizes mid-stream, mirroring
+                # SileroVAD; the old list-based buffer grew without bound
+                # here.
+                if utt_buf is not None and (
+                    utt_frames >= self.max_frames
+                    or utt_len + len(frame) > utt_buf.shape[0]
+                ):
+                    if not command_executed:
+                        await _finalize()
+                    _reset()
+
+                if utt_buf is None:
+                    # First speech frame - start a pooled utterance and
+                    # prepend the pre-buffer
+                    utt_buf = utterance_pool.acquire()
+                    utt_len = utt_frames = 0
+                    for pre in self._pre_buf:
+                        _append(pre)
                     self._pre_buf.clear()
                     metrics.record_speech_start()
                     benchmark.record_speech_start()
                     command_executed = False
                     last_early_text = ""
 
-                speech_buf.append(frame)
+                _append(frame)
                 silence_ctr = 0
                 frames_since_check += 1
 
                 # Early transcription check
                 if (not command_executed and
-                    len(speech_buf) >= self.min_speech_frames and
+                    utt_frames >= self.min_speech_frames and
                     frames_since_check >= self.early_check_frames):
 
                     frames_since_check = 0
-                    audio = np.concatenate(speech_buf, dtype=np.float32)
+                    audio = utt_buf[:utt_len]
 
                     # Run early transcription
                     t0 = time.perf_counter()
@@ -176,84 +291,39 @@ class FastVAD:
                             metrics.record_command_execute(cmd_name, exec_dt)
 
                             # Record for benchmark
-                            duration_ms = len(speech_buf) * self.frame_ms
-                            audio_duration_ms = len(speech_buf) * self.frame_ms
-                            benchmark.record_vad_complete(duration_ms, audio_duration_ms)
+                            duration_ms = utt_frames * self.frame_ms
+                            benchmark.record_vad_complete(duration_ms, duration_ms)
                             benchmark.record_transcription(dt)
                             benchmark.record_command(cmd_name, text, True, exec_dt, early_match=True)
 
-                            # Mark as executed, but keep collecting
-                            # (in case user continues speaking)
-                            command_executed = True
-
-                            # Clear buffer and reset
+                            # Done with this utterance - release the
+                            # buffer; continued speech starts a new one.
                             metrics.record_vad_emit(duration_ms)
-                            speech_buf.clear()
-                            self._pre_buf.clear()
-                            silence_ctr = 0
+                            _reset()
 
             else:
                 # Silence/non-speech
-                if speech_buf:
+                if utt_buf is not None:
                     silence_ctr += 1
 
                     # Check for utterance end
-                    if silence_ctr >= self.silence_frames or len(speech_buf) >= self.max_frames:
+                    if silence_ctr >= self.silence_frames or utt_frames >= self.max_frames:
                         if not command_executed:
-                            # No early match - do final transcription
-                            audio = np.concatenate(speech_buf, dtype=np.float32)
-                            duration_ms = len(speech_buf) * self.frame_ms
-
-                            logger.info(
-                                "FastVAD flushing utterance: %d frames (~%.2f s)",
-                                len(speech_buf), duration_ms / 1000
-                            )
-                            metrics.record_vad_emit(duration_ms)
-
-                            # Final transcription
-                            t0 = time.perf_counter()
-                            text = await asyncio.get_running_loop().run_in_executor(
-                                None, self.transcribe, audio
-                            )
-                            dt = (time.perf_counter() - t0) * 1000
-
-                            if text:
-                                metrics.record_transcription(text, dt)
-                                benchmark.record_vad_complete(duration_ms, duration_ms)
-                                benchmark.record_transcription(dt)
-
-                                matched, cmd_name, args, _ = self.match(text)
-
-                                if matched and cmd_name:
-                                    metrics.record_command_match(cmd_name, matched=True)
-                                    t1 = time.perf_counter()
-                                    self.execute(cmd_name, args)
-                                    exec_dt = (time.perf_counter() - t1) * 1000
-                                    metrics.record_command_execute(cmd_name, exec_dt)
-                                    benchmark.record_command(cmd_name, text, True, exec_dt, early_match=False)
-                                else:
-                                    metrics.record_command_match(None, matched=False)
-                                    benchmark.record_command("none", text, False, 0.0, early_match=False)
-                                    logger.debug("No command matched: %r", text)
-
-                        # Reset state
-                        speech_buf.clear()
-                        self._pre_buf.clear()
-                        silence_ctr = 0
-                        frames_since_check = 0
-                        command_executed = False
-                        last_early_text = ""
+                            await _finalize()
+                        _reset()
 
             self.in_q.task_done()
 
     def _lazy_init(self):
         if self._model is not None:
             return
-        self._model, _ = torch.hub.load(_REPO, _MODEL, trust_repo=True)
-        self._model.eval().to("cpu")
+        self._model = load_vad_model()
 
     def _infer(self, pcm: np.ndarray) -> float:
         """Return speech probability for one frame."""
+        if isinstance(self._model, OnnxVAD):
+            return self._model(pcm)
+
         with torch.no_grad():
             wav = torch.from_numpy(pcm).unsqueeze(0)
             logits = self._model(wav, self.sr)
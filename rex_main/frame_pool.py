@@ -0,0 +1,74 @@
+"""frame_pool.py
+Reusable float32 buffer pool for the VAD -> Whisper hand-off.
+
+Every utterance the VAD flushes used to allocate a fresh array of up to
+max_utterance samples (640 KB at 16 kHz x 10 s); over a long-running
+session that is steady garbage on the hot path.  The pool hands the same
+few canonical-size buffers back and forth instead: the VAD acquires one
+and concatenates into it, Whisper releases it after transcription.
+
+Only buffers of the pool's exact shape re-enter the pool (views are
+resolved to their base array first); anything else simply falls back to
+the garbage collector, so unusual sizes degrade gracefully rather than
+polluting the free list.
+"""
+
+from __future__ import annotations
+
+import queue
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["FramePool", "utterance_pool"]
+
+
+class FramePool:
+    """Pool of fixed-shape NumPy buffers with allocate-on-miss semantics.
+
+    Parameters
+    ----------
+    shape : tuple[int, ...]
+        Canonical buffer shape; only buffers of exactly this shape are
+        recycled.
+    dtype : numpy dtype, default float32
+        Element type of pooled buffers.
+    maxsize : int, default 8
+        Upper bound on idle buffers retained; extras are dropped.
+    """
+
+    def __init__(self, shape: tuple[int, ...], *, dtype=np.float32, maxsize: int = 8):
+        self._shape = tuple(shape)
+        self._dtype = np.dtype(dtype)
+        self._maxsize = maxsize
+        self._q: "queue.SimpleQueue[np.ndarray]" = queue.SimpleQueue()
+
+    def acquire(self) -> np.ndarray:
+        """Return a pooled buffer, allocating a fresh one on a miss."""
+        try:
+            return self._q.get_nowait()
+        except queue.Empty:
+            return np.empty(self._shape, self._dtype)
+
+    def release(self, buf: np.ndarray) -> None:
+        """Return *buf* (or the base of a view into it) for reuse.
+
+        Foreign arrays - wrong shape or dtype - are ignored and left to
+        the garbage collector, so callers can release unconditionally.
+        """
+        base = buf.base if buf.base is not None else buf
+        if (
+            isinstance(base, np.ndarray)
+            and base.shape == self._shape
+            and base.dtype == self._dtype
+            and self._q.qsize() < self._maxsize
+        ):
+            self._q.put(base)
+
+
+# Shared pool for full-utterance buffers: 16 kHz x 10 s, the pipeline's
+# default max_utterance ceiling.  VADs configured differently just miss the
+# pool and allocate as before.
+utterance_pool = FramePool((160_000,))
@@ -16,6 +16,7 @@ CPU-heavy).
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import re
 import time
@@ -25,7 +26,8 @@ import rex_main.commands as commands
 import rex_main.steelseries as steelseries
 from rex_main.metrics import metrics
 
-__all__ = ["dispatch_command", "COMMAND_PATTERNS", "NO_EARLY_MATCH_COMMANDS"]
+__all__ = ["dispatch_command", "match_command", "COMMAND_PATTERNS",
+           "NO_EARLY_MATCH_COMMANDS"]
 
 logger = logging.getLogger(__name__)
 
@@ -45,46 +47,137 @@ COMMAND_PATTERNS: list[tuple[re.Pattern[str], str]] = [
 
     # Music commands
     #  play / pause
-    (re.compile(rf"^{_WORD}stop\s+music{_WORD}{_END}",  re.I), "stop_music"),
-    (re.compile(rf"^{_WORD}play\s+music{_WORD}{_END}", re.I), "play_music"),
+    (re.compile(rf"^{_WORD}stop\s+music{_WORD}{_END}",  re.I | re.ASCII), "stop_music"),
+    (re.compile(rf"^{_WORD}play\s+music{_WORD}{_END}", re.I | re.ASCII), "play_music"),
 
 
     #  track navigation
-    (re.compile(rf"^{_WORD}(?:next|skip){_WORD}{_END}", re.I), "next_track"),
-    (re.compile(rf"^{_WORD}(?:last|previous){_WORD}{_END}", re.I), "previous_track"),
-    (re.compile(rf"^{_WORD}restart{_WORD}{_END}", re.I), "restart_track"),
-    (re.compile(rf"^{_WORD}search\s+(.+?)(?:\s+by\s+(.+?))?{_END}", re.I), "search_song"),
+    (re.compile(rf"^{_WORD}(?:next|skip){_WORD}{_END}", re.I | re.ASCII), "next_track"),
+    (re.compile(rf"^{_WORD}(?:last|previous){_WORD}{_END}", re.I | re.ASCII), "previous_track"),
+    (re.compile(rf"^{_WORD}restart{_WORD}{_END}", re.I | re.ASCII), "restart_track"),
+    (re.compile(rf"^{_WORD}search\s+(.+?)(?:\s+by\s+(.+?))?{_END}", re.I | re.ASCII), "search_song"),
 
 
     #  volume control
-    (re.compile(rf"^{_WORD}volume up{_END}",   re.I), "volume_up"),
-    (re.compile(rf"^{_WORD}volume down{_END}", re.I), "volume_down"),
-    (re.compile(rf"^{_WORD}volume\s+(\d{{1,3}}){_WORD}{_END}", re.I), "set_volume"),
+    (re.compile(rf"^{_WORD}volume up{_END}",   re.I | re.ASCII), "volume_up"),
+    (re.compile(rf"^{_WORD}volume down{_END}", re.I | re.ASCII), "volume_down"),
+    (re.compile(rf"^{_WORD}volume\s+(\d{{1,3}}){_WORD}{_END}", re.I | re.ASCII), "set_volume"),
 
 
     #  like / dislike
-    (re.compile(rf"^{_WORD}like{_WORD}{_END}",    re.I), "like"),
-    (re.compile(rf"^{_WORD}dislike{_WORD}{_END}", re.I), "dislike"),
+    (re.compile(rf"^{_WORD}like{_WORD}{_END}",    re.I | re.ASCII), "like"),
+    (re.compile(rf"^{_WORD}dislike{_WORD}{_END}", re.I | re.ASCII), "dislike"),
 
     #  Others commands
-    (re.compile(rf"^{_WORD}this\s+is\s+so\s+sad{_WORD}{_END}", re.I), "so_sad"),
-    (re.compile(rf"^{_WORD}shuffle\s+on{_END}", re.I),  "shuffle_on"),
-    (re.compile(rf"^{_WORD}shuffle\s+off{_END}", re.I), "shuffle_off"),
-    (re.compile(rf"^{_WORD}repeat\s+(off|context|track){_END}", re.I), "set_repeat"),       # captures “off”, “context”, or “track”)
-    (re.compile(rf"^{_WORD}next\s+track(?:\s*[,;:]\s*|\s+)(.+?){_END}", re.I), "queue_track"),  # Queue a specific URI (e.g. “next track (song name)”)
-    (re.compile(rf"^{_WORD}(?:what(?:'s)?\s+playing|current\s+track\s+info|track\s+info){_END}",re.I), "current_track_info"),
+    (re.compile(rf"^{_WORD}this\s+is\s+so\s+sad{_WORD}{_END}", re.I | re.ASCII), "so_sad"),
+    (re.compile(rf"^{_WORD}shuffle\s+on{_END}", re.I | re.ASCII),  "shuffle_on"),
+    (re.compile(rf"^{_WORD}shuffle\s+off{_END}", re.I | re.ASCII), "shuffle_off"),
+    (re.compile(rf"^{_WORD}repeat\s+(off|context|track){_END}", re.I | re.ASCII), "set_repeat"),       # captures “off”, “context”, or “track”)
+    (re.compile(rf"^{_WORD}next\s+track(?:\s*[,;:]\s*|\s+)(.+?){_END}", re.I | re.ASCII), "queue_track"),  # Queue a specific URI (e.g. “next track (song name)”)
+    (re.compile(rf"^{_WORD}(?:what(?:'s)?\s+playing|current\s+track\s+info|track\s+info){_END}",re.I | re.ASCII), "current_track_info"),
 
 
     #  Switching music apps (spotify, youtube music)
-    (re.compile(rf"^{_WORD}switch\s+to\s+spotify{_END}", re.I), "configure_spotify"),
-    (re.compile(rf"^{_WORD}switch\s+to\s+youtube\s+music{_END}", re.I), "configure_ytmd"),
+    (re.compile(rf"^{_WORD}switch\s+to\s+spotify{_END}", re.I | re.ASCII), "configure_spotify"),
+    (re.compile(rf"^{_WORD}switch\s+to\s+youtube\s+music{_END}", re.I | re.ASCII), "configure_ytmd"),
 
     # Clipping (SteelSeries Moments)
     # Multiple phrases for better recognition - "capture" and "record" have harder consonants
-    (re.compile(rf"^{_WORD}(?:clip\s+(?:that|it)|save\s+(?:that|clip)|capture\s+(?:that|it)|record\s+(?:that|clip)){_END}", re.I), "clip_that"),
+    (re.compile(rf"^{_WORD}(?:clip\s+(?:that|it)|save\s+(?:that|clip)|capture\s+(?:that|it)|record\s+(?:that|clip)){_END}", re.I | re.ASCII), "clip_that"),
 ]
 
 
+# Fused alternation: one regex-engine entry per utterance instead of one
+# .match() call per pattern. Each alternative is wrapped in a named group
+# whose name is its handler, so dispatch is m.lastgroup plus a slice of the
+# inner capture groups. Alternation order preserves first-match semantics.
+# Compiled WITHOUT re.I: the input is lower-cased once in match_command, so
+# the engine skips per-character case folding across every pattern.
+_FUSED = re.compile(
+    "|".join(
+        f"(?P<{name}>{pattern.pattern})" for pattern, name in COMMAND_PATTERNS
+    ),
+    re.ASCII,
+)
+
+# For each handler, the range of positional capture groups nested inside
+# its named alternative (used to slice m.groups() down to handler args).
+_ARG_RANGES: dict[str, tuple[int, int]] = {}
+_indices = [_FUSED.groupindex[name] for _, name in COMMAND_PATTERNS]
+for _i, (_, _name) in enumerate(COMMAND_PATTERNS):
+    _start = _indices[_i]
+    _end = _indices[_i + 1] - 1 if _i + 1 < len(_indices) else _FUSED.groups
+    _ARG_RANGES[_name] = (_start, _end)
+del _i, _name, _start, _end, _indices
+
+
+# O(1) fast path: most commands are fixed phrases, so a dict lookup on the
+# normalized text dispatches them without entering the regex engine at all.
+# A miss (extra words, odd spacing, parameterized commands) simply falls
+# through to the fused regex, so this can only add coverage, never change
+# which handler wins.
+_EXACT: dict[str, str] = {
+    "stop music": "stop_music",
+    "play music": "play_music",
+    "next": "next_track",
+    "skip": "next_track",
+    "last": "previous_track",
+    "previous": "previous_track",
+    "restart": "restart_track",
+    "volume up": "volume_up",
+    "volume down": "volume_down",
+    "like": "like",
+    "dislike": "dislike",
+    "this is so sad": "so_sad",
+    "shuffle on": "shuffle_on",
+    "shuffle off": "shuffle_off",
+    "what's playing": "current_track_info",
+    "what playing": "current_track_info",
+    "current track info": "current_track_info",
+    "track info": "current_track_info",
+    "switch to spotify": "configure_spotify",
+    "switch to youtube music": "configure_ytmd",
+    "clip that": "clip_that",
+    "clip it": "clip_that",
+    "save that": "clip_that",
+    "save clip": "clip_that",
+    "capture that": "clip_that",
+    "capture it": "clip_that",
+    "record that": "clip_that",
+    "record clip": "clip_that",
+}
+
+
+def match_command(text: str) -> tuple[str, tuple[str, ...]] | None:
+    """Match *text* against the command table.
+
+    Returns (handler_name, args) for the first matching command, or None.
+    The string is lower-cased once here; both the exact-phrase dict and the
+    fused regex then run case-sensitively instead of case-folding every
+    character per pattern.
+    """
+    norm = text.lower()
+    func_name = _EXACT.get(norm.strip(" .!?"))
+    if func_name is not None:
+        return func_name, ()
+
+    m = _FUSED.match(norm)
+    if m is None:
+        return None
+    name = m.lastgroup
+    start, end = _ARG_RANGES[name]
+    if len(norm) != len(text):
+        # Rare non-ASCII case where lower() changed the length and spans no
+        # longer line up with the original string.
+        return name, tuple(m.groups()[start:end])
+    # Slice args out of the original text so search queries etc. keep the
+    # capitalization Whisper produced.
+    return name, tuple(
+        text[m.start(g):m.end(g)] if m.start(g) != -1 else None
+        for g in range(start + 1, end + 1)
+    )
+
+
 # Public coroutine
 async def dispatch_command(text_queue: "asyncio.Queue[str]"):
     """Forever task that reads recognised text and triggers handlers."""
@@ -94,18 +187,14 @@ async def dispatch_command(text_queue: "asyncio.Queue[str]"):
         text = (await text_queue.get()).strip()
         logger.debug("Received text: %s", text)
 
-        matched = False
-        for pattern, func_name in COMMAND_PATTERNS:
-            m = pattern.match(text)
-            if m:
-                matched = True
-                logger.info("Matched command '%s'", func_name)
-                # Record match for metrics
-                metrics.record_command_match(func_name, matched=True)
-                _call_handler(func_name, m.groups())
-                break
-
-        if not matched:
+        result = match_command(text)
+        if result is not None:
+            func_name, args = result
+            logger.info("Matched command '%s'", func_name)
+            # Record match for metrics
+            metrics.record_command_match(func_name, matched=True)
+            await _call_handler(func_name, args)
+        else:
             logger.debug("No command matched for input: %r", text)
             # Record unmatched for metrics
             metrics.record_command_match(None, matched=False)
@@ -115,11 +204,16 @@ async def dispatch_command(text_queue: "asyncio.Queue[str]"):
 
 # Helpers
 
-def _call_handler(func_name: str, args: tuple[str, ...]):
-    """Look up handler in commands or steelseries module and invoke it with *args*."""
+async def _call_handler(func_name: str, args: tuple[str, ...]):
+    """Look up handler in commands or steelseries module and invoke it with *args*.
+
+    Coroutine handlers are awaited; plain (blocking) handlers run in the
+    default executor so HTTP round-trips to music services never stall
+    the event loop that the audio pipeline shares.
+    """
 
-    # Try commands module first, then steelseries module
-    func: Callable[..., None] | None = getattr(commands, func_name, None)
+    # Dispatch table first (one dict probe), then the steelseries module
+    func: Callable[..., None] | None = commands.HANDLERS.get(func_name)
     if func is None:
         func = getattr(steelseries, func_name, None)
     if not callable(func):
@@ -128,7 +222,12 @@ def _call_handler(func_name: str, args: tuple[str, ...]):
 
     try:
         t0 = time.perf_counter()
-        func(*args)
+        if asyncio.iscoroutinefunction(func):
+            await func(*args)
+        else:
+            await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(func, *args)
+            )
         dt = (time.perf_counter() - t0) * 1000
         # Record execution time for metrics
         metrics.record_command_execute(func_name, dt)
@@ -104,8 +104,27 @@ class MetricsCollector:
         # Session start time
         self._session_start = time.time()
 
+        # Bumped on every record_* call; consumers (dashboard broadcaster)
+        # compare it to skip re-serializing when nothing changed.
+        self._version = 0
+
         logger.debug("MetricsCollector initialized")
 
+    @staticmethod
+    def _quantize_ms(ms: float) -> int:
+        """Clamp a latency to whole uint16 milliseconds (65.5 s ceiling).
+
+        Integer samples serialize to a fraction of the bytes of full-repr
+        floats in the dashboard history payloads, and millisecond precision
+        is all the charts display anyway.
+        """
+        return int(min(max(ms, 0.0), 65535.0))
+
+    @property
+    def version(self) -> int:
+        """Monotonic change counter; unchanged value means no new events."""
+        return self._version
+
     def record_speech_start(self) -> None:
         """Record when VAD first detects speech in an utterance."""
         with self._lock:
@@ -115,6 +134,7 @@ class MetricsCollector:
                 timestamp=now,
                 event_type=EventType.SPEECH_START
             ))
+            self._version += 1
 
     def record_vad_emit(self, duration_ms: float) -> None:
         """Record when VAD emits a complete utterance.
@@ -131,7 +151,9 @@ class MetricsCollector:
             if self._current_speech_start:
                 # This is the time from speech start to utterance emission
                 # Includes: speech duration + silence timeout
-                vad_latency = (now - self._current_speech_start) * 1000
+                vad_latency = self._quantize_ms(
+                    (now - self._current_speech_start) * 1000
+                )
                 self._vad_latencies.append(vad_latency)
 
             self._events.append(MetricEvent(
@@ -140,6 +162,7 @@ class MetricsCollector:
                 latency_ms=vad_latency,
                 metadata={"duration_ms": duration_ms}
             ))
+            self._version += 1
 
     def record_transcription(self, text: str, latency_ms: float) -> None:
         """Record a completed transcription.
@@ -150,6 +173,7 @@ class MetricsCollector:
         """
         with self._lock:
             now = time.time()
+            latency_ms = self._quantize_ms(latency_ms)
             self._current_transcription_done = now
             self._total_transcriptions += 1
             self._whisper_latencies.append(latency_ms)
@@ -171,6 +195,7 @@ class MetricsCollector:
                 "execute_ms": None,
                 "e2e_ms": None
             })
+            self._version += 1
 
     def record_command_match(self, command_name: Optional[str], matched: bool) -> None:
         """Record whether a transcription matched a command.
@@ -200,6 +225,7 @@ class MetricsCollector:
             if self._recent_transcriptions:
                 self._recent_transcriptions[-1]["matched"] = matched
                 self._recent_transcriptions[-1]["command"] = command_name
+            self._version += 1
 
     def record_command_execute(self, command_name: str, latency_ms: float) -> None:
         """Record command execution completion.
@@ -210,6 +236,7 @@ class MetricsCollector:
         """
         with self._lock:
             now = time.time()
+            latency_ms = self._quantize_ms(latency_ms)
             self._execute_latencies.append(latency_ms)
 
             # Update command stats
@@ -219,7 +246,7 @@ class MetricsCollector:
             # Calculate end-to-end latency
             e2e_ms = None
             if self._current_speech_start:
-                e2e_ms = (now - self._current_speech_start) * 1000
+                e2e_ms = self._quantize_ms((now - self._current_speech_start) * 1000)
                 self._e2e_latencies.append(e2e_ms)
 
             self._events.append(MetricEvent(
@@ -238,6 +265,21 @@ class MetricsCollector:
             self._current_speech_start = None
             self._current_vad_emit = None
             self._current_transcription_done = None
+            self._version += 1
+
+    def snapshot(self, limit_recent: int = 10, limit_cmd: int = 10) -> Dict[str, Any]:
+        """Build the dashboard payload in a single lock hold.
+
+        One acquire/release instead of three, and the three views are
+        guaranteed to describe the same instant (the lock is reentrant, so
+        the individual getters below can still be called directly).
+        """
+        with self._lock:
+            return {
+                "stats": self.get_session_stats(),
+                "recent": self.get_recent_transcriptions(limit=limit_recent),
+                "commands": self.get_command_frequency()[:limit_cmd],
+            }
 
     def get_session_stats(self) -> Dict[str, Any]:
         """Get aggregated statistics for the current session."""
@@ -310,7 +352,7 @@ class MetricsCollector:
                 if event.timestamp < cutoff:
                     continue
 
-                ts = event.timestamp * 1000  # JavaScript timestamp
+                ts = int(event.timestamp * 1000)  # JavaScript timestamp
 
                 if event.event_type == EventType.VAD_EMIT and event.latency_ms:
                     vad_points.append({"x": ts, "y": event.latency_ms})
@@ -343,6 +385,7 @@ class MetricsCollector:
             self._current_vad_emit = None
             self._current_transcription_done = None
             self._session_start = time.time()
+            self._version += 1
             logger.info("Metrics reset")
 
     @staticmethod
@@ -17,9 +17,15 @@ async def print_metrics_loop(interval_seconds: int = 30):
     Args:
         interval_seconds: How often to print (default: 30 seconds)
     """
-    await asyncio.sleep(interval_seconds)  # Wait before first print
+    # Schedule against a monotonic deadline rather than sleeping a fixed
+    # interval after each print: the work inside the loop (stats + logging)
+    # would otherwise drift the tick later every iteration.
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time() + interval_seconds
 
     while True:
+        await asyncio.sleep(max(0.0, next_tick - loop.time()))
+        next_tick += interval_seconds
         try:
             stats = metrics.get_session_stats()
             commands = metrics.get_command_frequency()
@@ -39,5 +45,3 @@ async def print_metrics_loop(interval_seconds: int = 30):
                 logger.info("=" * 50)
         except Exception as e:
             logger.debug("Error printing metrics: %s", e)
-
-        await asyncio.sleep(interval_seconds)
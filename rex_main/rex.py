@@ -16,15 +16,18 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import functools
+import os
 import signal
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Any
 import numpy as np
 
 from rex_main.audio_stream import AudioStream
 from rex_main.vad_stream import SileroVAD
 from rex_main.whisper_worker import WhisperWorker
-from rex_main.matcher import dispatch_command, COMMAND_PATTERNS, NO_EARLY_MATCH_COMMANDS
+from rex_main.matcher import dispatch_command, match_command as match_text, NO_EARLY_MATCH_COMMANDS
 from rex_main.metrics_printer import print_metrics_loop
 from rex_main.benchmark import benchmark
 import rex_main.commands as commands
@@ -68,6 +71,93 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     return p.parse_args(argv)
 
 
+async def _supervise(factory, name: str):
+    """Run *factory*'s coroutine forever, restarting it after crashes.
+
+    A transient error inside one pipeline stage (a bad decode, a network
+    hiccup in a handler) used to bubble through asyncio.gather and cancel
+    every task, forcing a full restart including the multi-second Whisper
+    model reload.  The owning objects - and their loaded models - live
+    outside the coroutine, so restarting the coroutine alone is cheap.
+    Cancellation still propagates so Ctrl-C shuts down as before.
+    """
+    while True:
+        try:
+            await factory()
+            return  # factory completed normally
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Task %r crashed - restarting in 1 s", name)
+            await asyncio.sleep(1.0)
+
+
+def _pin_cpu_affinity() -> Optional[set[int]]:
+    """Pin the event-loop thread to two CPUs, reserving the rest for workers.
+
+    The VAD/audio tasks wake ~31 times a second; letting the scheduler
+    migrate them across cores under load costs L1/L2 refills and shows up
+    as jitter on the audio_q.get() path.  Linux-only (sched_setaffinity
+    is per-thread there) and skipped when fewer than 4 CPUs are actually
+    permitted, where partitioning would just starve one side.
+
+    Both sets are carved from os.sched_getaffinity(0), not cpu_count():
+    under a restricted cpuset (Docker --cpuset-cpus, taskset) the host
+    may have CPUs this process is not allowed to touch, and pinning to
+    those fails with EINVAL.
+
+    Returns the CPU set executor threads should pin themselves to, or
+    None when pinning is unavailable or was skipped.
+    """
+    if not hasattr(os, "sched_setaffinity"):
+        return None
+    allowed = sorted(os.sched_getaffinity(0))
+    if len(allowed) < 4:
+        return None
+    loop_cpus = set(allowed[:2])
+    worker_cpus = set(allowed[2:])
+    try:
+        os.sched_setaffinity(0, loop_cpus)
+    except OSError as e:
+        logger.debug("CPU pinning unavailable: %s", e)
+        return None
+    logger.debug(
+        "Pinned event loop to CPUs %s; executor threads use %s",
+        sorted(loop_cpus), sorted(worker_cpus),
+    )
+    return worker_cpus
+
+
+def _pin_worker_thread(cpus: set[int]) -> None:
+    """Executor-thread initializer: best-effort pin, never fatal.
+
+    An initializer that raises permanently breaks the ThreadPoolExecutor
+    (every subsequent submit raises BrokenThreadPool), so a pin failure
+    must degrade to an unpinned worker, not take down transcription.
+    """
+    try:
+        os.sched_setaffinity(0, cpus)
+    except OSError as e:
+        logger.debug("Worker CPU pin failed: %s", e)
+
+
+def install_uvloop() -> bool:
+    """Install the uvloop event-loop policy when available.
+
+    Must be called before asyncio.run(); a no-op (returning False) when
+    uvloop is not installed or on Windows.  The scheduler sits on the
+    ~31 Hz audio hot path, so the cheaper uvloop wakeups are worth taking
+    opportunistically.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    logger.debug("uvloop event loop policy installed")
+    return True
+
+
 # Main orchestration
 
 async def run_assistant(opts: Any, config: Optional[dict] = None):
@@ -130,6 +220,28 @@ async def run_assistant(opts: Any, config: Optional[dict] = None):
     logger.info("=" * 50)
     logger.info("Listening... (Press Ctrl+C to exit)")
 
+    # Small named default executor: transcription and command handlers are
+    # the only run_in_executor users, so the stdlib's up-to-32-thread pool
+    # is overkill, and the "rex" prefix keeps py-spy/top output readable.
+    # On Linux the event loop is pinned to CPUs 0-1 and executor threads
+    # (Whisper inference, handlers) pin themselves to the remaining cores,
+    # so heavy decode work never evicts the audio loop from its cache.
+    # Let command handlers (which run in executor threads) schedule
+    # deferred work - e.g. the YTMD volume debounce - onto this loop.
+    commands.bind_event_loop()
+
+    worker_cpus = _pin_cpu_affinity()
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(
+            max_workers=max(2, (os.cpu_count() or 2) - 1),
+            thread_name_prefix="rex",
+            initializer=(
+                functools.partial(_pin_worker_thread, worker_cpus)
+                if worker_cpus else None
+            ),
+        )
+    )
+
     # Queues
     audio_q: "asyncio.Queue[np.ndarray]" = asyncio.Queue(maxsize=50)
     speech_q: "asyncio.Queue[np.ndarray]" = asyncio.Queue(maxsize=10)
@@ -149,6 +261,12 @@ async def run_assistant(opts: Any, config: Optional[dict] = None):
     benchmark.start_monitoring(interval_seconds=1.0)
     logger.info("Benchmark monitoring started (data saved to ~/.rex/benchmarks/)")
 
+    # Honor the configured model cache so weights downloaded during setup
+    # are reused here instead of fetched again into a separate cache.
+    cache_dir = None
+    if config:
+        cache_dir = config.get("model", {}).get("cache_dir")
+
     async with AudioStream(audio_q, pulse_server=pulse_server):
         whisper = WhisperWorker(
             speech_q,
@@ -156,10 +274,13 @@ async def run_assistant(opts: Any, config: Optional[dict] = None):
             model_name=opts.model,
             device=opts.device,
             beam_size=opts.beam,
+            download_root=os.path.expanduser(cache_dir) if cache_dir else None,
         )
 
-        # Pre-warm Whisper model to eliminate cold-start latency
-        whisper.warmup()
+        # Pre-warm Whisper model to eliminate cold-start latency.  Runs in
+        # a thread so model load + first inference don't block the loop
+        # (audio capture is already live inside this context manager).
+        await asyncio.to_thread(whisper.warmup)
 
         if low_latency:
             # Use FastVAD with early command detection for lowest latency
@@ -175,17 +296,16 @@ async def run_assistant(opts: Any, config: Optional[dict] = None):
 
                 Returns: (matched, func_name, args, allow_early_match)
                 """
-                text = text.strip()
-                for pattern, func_name in COMMAND_PATTERNS:
-                    m = pattern.match(text)
-                    if m:
-                        allow_early = func_name not in NO_EARLY_MATCH_COMMANDS
-                        return (True, func_name, m.groups(), allow_early)
+                result = match_text(text.strip())
+                if result is not None:
+                    func_name, args = result
+                    allow_early = func_name not in NO_EARLY_MATCH_COMMANDS
+                    return (True, func_name, args, allow_early)
                 return (False, None, (), True)
 
             def execute_command(func_name: str, args: tuple) -> None:
                 """Execute a matched command."""
-                func = getattr(commands, func_name, None)
+                func = commands.HANDLERS.get(func_name)
                 if callable(func):
                     func(*args)
 
@@ -200,18 +320,27 @@ async def run_assistant(opts: Any, config: Optional[dict] = None):
             )
 
             tasks = [
-                asyncio.create_task(fast_vad.run(), name="fast_vad"),
-                asyncio.create_task(print_metrics_loop(30), name="metrics_printer"),
+                asyncio.create_task(_supervise(fast_vad.run, "fast_vad"), name="fast_vad"),
+                asyncio.create_task(
+                    _supervise(functools.partial(print_metrics_loop, 30), "metrics_printer"),
+                    name="metrics_printer",
+                ),
             ]
         else:
             # Standard mode with separate VAD -> Whisper -> Matcher pipeline
             vad = SileroVAD(audio_q, speech_q, silence_ms=400)
 
             tasks = [
-                asyncio.create_task(vad.run(), name="vad"),
-                asyncio.create_task(whisper.run(), name="whisper"),
-                asyncio.create_task(dispatch_command(text_q), name="matcher"),
-                asyncio.create_task(print_metrics_loop(30), name="metrics_printer"),
+                asyncio.create_task(_supervise(vad.run, "vad"), name="vad"),
+                asyncio.create_task(_supervise(whisper.run, "whisper"), name="whisper"),
+                asyncio.create_task(
+                    _supervise(functools.partial(dispatch_command, text_q), "matcher"),
+                    name="matcher",
+                ),
+                asyncio.create_task(
+                    _supervise(functools.partial(print_metrics_loop, 30), "metrics_printer"),
+                    name="metrics_printer",
+                ),
             ]
 
         # Handle Ctrl-C for graceful shutdown
@@ -227,6 +356,13 @@ async def run_assistant(opts: Any, config: Optional[dict] = None):
             logger.info("Shutdown requested - waiting for tasks to finish...")
             await asyncio.gather(*tasks, return_exceptions=True)
         finally:
+            # Flush in-flight sends and close the media client's HTTP
+            # sessions before the loop goes away.
+            try:
+                await commands.aclose_service()
+            except Exception as e:
+                logger.warning("Failed to close media service cleanly: %s", e)
+
             # Stop benchmark monitoring and export session data
             benchmark.stop_monitoring()
             try:
@@ -257,4 +393,5 @@ main = run_assistant
 
 # Entry-point
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(run_assistant(parse_args()))
